@@ -3,10 +3,10 @@ import logging
 import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, request
 from flask_socketio import SocketIO
 
-from app.models import EventType, RemediationStatus
+from app.models import EventType, RemediationStatus, dumps
 from app.config import AppConfig
 
 logger = logging.getLogger(__name__)
@@ -57,7 +57,7 @@ def _api_response(success: bool, data: Any = None, error: str = None, status_cod
         status_code: HTTP status code
 
     Returns:
-        Tuple of (response dict, status code)
+        Tuple of (JSON response, status code)
     """
     response = {
         'success': success,
@@ -65,7 +65,9 @@ def _api_response(success: bool, data: Any = None, error: str = None, status_cod
         'data': data,
         'error': error
     }
-    return jsonify(response), status_code
+    # data may hold model instances directly; dumps() encodes them without
+    # the intermediate to_dict() pass when orjson is available
+    return current_app.response_class(dumps(response), mimetype='application/json'), status_code
 
 
 # Health & Status Endpoints
@@ -200,7 +202,7 @@ def get_events():
     events = _monitor.get_events(event_type=filter_type, limit=limit)
 
     return _api_response(True, {
-        'events': [event.to_dict() for event in events],
+        'events': events,
         'count': len(events)
     })
 
@@ -220,11 +222,11 @@ def get_violations():
         logger.debug(f"/events/violations returning: count={len(violations)}, active_only={active_only}")
 
         if not active_only:
-            # Include resolved violations (would need to track these separately)
-            pass
+            # Include recently resolved violations
+            violations = _monitor.get_resolved_violations() + violations
 
         return _api_response(True, {
-            'violations': [v.to_dict() for v in violations],
+            'violations': violations,
             'count': len(violations)
         })
     except Exception as e:
@@ -659,7 +661,7 @@ def get_config():
             'mock_mode': _config.aap.mock_mode,
             'base_url': _config.aap.base_url if _config.aap.base_url else '[not set]',
             'verify_ssl': _config.aap.verify_ssl,
-            'job_templates': _config.aap.job_templates
+            'job_templates': dict(_config.aap.job_templates)
         },
         'remediation': {
             'auto_remediate': _config.remediation.auto_remediate,
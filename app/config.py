@@ -1,13 +1,103 @@
 """Configuration loader and validator for PLC Self-Healing Middleware."""
 import os
 import re
-import yaml
-from typing import Dict, Any, Optional, List
+import sys
+from collections import OrderedDict, deque
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Optional, List, Mapping, Tuple
 from pathlib import Path
 from dataclasses import dataclass, field
 
 
-@dataclass
+# Matches ${VAR_NAME} and ${VAR_NAME:-default}
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+
+def _replace_env_var(match: "re.Match[str]", environ: Mapping[str, str] = os.environ) -> str:
+    """Resolve a single ${...} match against the environment.
+
+    Args:
+        match: Regex match for an ${VAR_NAME} or ${VAR_NAME:-default} pattern
+        environ: Environment mapping to resolve variables from
+
+    Returns:
+        Environment value, the default value, or the original pattern if unset
+    """
+    var_expr = match.group(1)  # e.g., "VAR_NAME" or "VAR_NAME:-default"
+
+    # Check if default value is specified
+    if ':-' in var_expr:
+        var_name, default_value = var_expr.split(':-', 1)
+        return environ.get(var_name.strip(), default_value.strip())
+
+    # Return original pattern if not found (for backward compatibility)
+    return environ.get(var_expr.strip(), match.group(0))
+
+
+class _RecordingEnviron(Mapping[str, str]):
+    """Read-through view of an environment that records every variable looked up.
+
+    The recorded names and values identify exactly the part of the
+    environment a config file depends on.
+    """
+
+    def __init__(self, environ: Mapping[str, str]):
+        self._environ = environ
+        # Variable name -> value seen (None if unset), in lookup order
+        self.lookups: Dict[str, Optional[str]] = {}
+
+    def __getitem__(self, name: str) -> str:
+        value = self._environ.get(name)
+        self.lookups.setdefault(name, value)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __iter__(self):
+        return iter(self._environ)
+
+    def __len__(self) -> int:
+        return len(self._environ)
+
+
+def _build_predicate(failure_condition: str, nominal: Any, failure_value: Any,
+                     low: Optional[float], high: Optional[float]) -> Callable[[Any], bool]:
+    """Specialize a tag's failure condition into a single violation check.
+
+    Args:
+        failure_condition: equals, not_equals, outside_range, below or above
+        nominal: Expected nominal value (not_equals compares against this)
+        failure_value: Value that signals failure (equals)
+        low: Lower threshold (outside_range, below)
+        high: Upper threshold (outside_range, above)
+
+    Returns:
+        Callable taking a tag value and returning True if it violates the condition
+    """
+    if failure_condition == 'equals':
+        return lambda value: value == failure_value
+    if failure_condition == 'not_equals':
+        return lambda value: value != nominal
+    if failure_condition == 'outside_range':
+        if low is not None and high is not None:
+            return lambda value: value < low or value > high
+        if low is not None:
+            return lambda value: value < low
+        if high is not None:
+            return lambda value: value > high
+    elif failure_condition == 'below' and low is not None:
+        return lambda value: value < low
+    elif failure_condition == 'above' and high is not None:
+        return lambda value: value > high
+    return lambda value: False
+
+
+_DEFAULT_FAILURE_TYPES = (
+    "value_anomaly", "network_timeout", "connection_loss", "service_crash"
+)
+
+
+@dataclass(frozen=True, slots=True)
 class PLCConfig:
     """PLC connection configuration."""
     ip_address: str
@@ -16,9 +106,11 @@ class PLCConfig:
     poll_interval_ms: int = 1000
     mock_mode: bool = False  # Enable mock mode for graceful handling of unsupported services
     protocol_mode: str = "default"  # Protocol mode: "default" (use pycomm3 default) or "serial" (disable MSP, use serial methods)
+    read_cache_ms: int = 0  # Serve repeated reads of a tag from cache for this long (0 disables)
+    inter_read_delay_ms: int = 0  # Pause between tag reads in serial protocol mode
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TagConfig:
     """Tag monitoring configuration."""
     name: str
@@ -28,20 +120,33 @@ class TagConfig:
     failure_value: Optional[Any] = None
     failure_threshold_low: Optional[float] = None
     failure_threshold_high: Optional[float] = None
+    # Compiled from failure_condition in __post_init__; returns True on violation
+    predicate: Callable[[Any], bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'predicate', _build_predicate(
+            self.failure_condition, self.nominal, self.failure_value,
+            self.failure_threshold_low, self.failure_threshold_high
+        ))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AAPConfig:
-    """Ansible Automation Platform configuration."""
+    """Ansible Automation Platform configuration.
+
+    job_templates is a read-only mapping when loaded from file; callers that
+    need to modify it must take an explicit dict() copy. Mappings aren't
+    hashable, so neither is an AAPConfig; hash() raises TypeError.
+    """
     enabled: bool = True
     mock_mode: bool = True
     base_url: str = ""
     verify_ssl: bool = True
     token: str = ""
-    job_templates: Dict[str, int] = field(default_factory=dict)
+    job_templates: Mapping[str, int] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RemediationConfig:
     """Remediation configuration."""
     auto_remediate: bool = False
@@ -49,19 +154,17 @@ class RemediationConfig:
     max_retries: int = 3
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChaosConfig:
     """Chaos engineering configuration."""
     enabled: bool = False
     failure_injection_rate: float = 0.05
-    failure_types: List[str] = field(default_factory=lambda: [
-        "value_anomaly", "network_timeout", "connection_loss", "service_crash"
-    ])
+    failure_types: Tuple[str, ...] = _DEFAULT_FAILURE_TYPES
     network_timeout_ms: int = 5000
     anomaly_duration_seconds: int = 10
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DashboardConfig:
     """Dashboard configuration."""
     refresh_interval_ms: int = 1000
@@ -69,18 +172,25 @@ class DashboardConfig:
     chart_data_points: int = 100
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Logging configuration."""
     level: str = "INFO"
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
-    """Application configuration container."""
+    """Application configuration container.
+
+    tags is a read-only mapping when loaded from file; callers that need to
+    modify it must take an explicit dict() copy. Frozen means immutable, not
+    hashable: tags (and aap.job_templates) are mappings, so hash() raises
+    TypeError. Key caches on something else, as ConfigLoader does with the
+    config file.
+    """
     plc: PLCConfig
-    tags: Dict[str, TagConfig]
+    tags: Mapping[str, TagConfig]
     aap: AAPConfig
     remediation: RemediationConfig
     chaos: ChaosConfig
@@ -88,6 +198,141 @@ class AppConfig:
     logging: LoggingConfig
 
 
+_VALID_PROTOCOL_MODES = frozenset(('default', 'serial'))
+_VALID_LOG_LEVELS = frozenset(('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'))
+
+# Accepted spellings for boolean fields given as strings (e.g. quoted in YAML)
+_TRUE_STRINGS = frozenset(('true', 'yes', 'on', '1'))
+_FALSE_STRINGS = frozenset(('false', 'no', 'off', '0', ''))
+
+
+def _to_bool(value: Any) -> bool:
+    """Convert a boolean field, parsing strings such as "false" instead of truth-testing them."""
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in _TRUE_STRINGS:
+            return True
+        if text in _FALSE_STRINGS:
+            return False
+        raise ValueError(f"expected a boolean, got '{value}'")
+    return bool(value)
+
+
+def _protocol_mode(value: Any) -> str:
+    """Normalize and validate PLC protocol_mode."""
+    protocol_mode = str(value).lower()
+    if protocol_mode not in _VALID_PROTOCOL_MODES:
+        raise ValueError(
+            f"Invalid protocol_mode '{protocol_mode}'. Must be 'default' or 'serial'"
+        )
+    return protocol_mode
+
+
+def _log_level(value: Any) -> str:
+    """Normalize and validate logging level."""
+    level = str(value).upper()
+    if level not in _VALID_LOG_LEVELS:
+        raise ValueError(
+            f"Invalid log level '{level}'. Must be one of: DEBUG, INFO, WARNING, ERROR, CRITICAL"
+        )
+    return level
+
+
+def _failure_types(value: Any) -> Tuple[str, ...]:
+    """Return chaos failure types, falling back to defaults for non-list values."""
+    # A list comes from YAML or from a comma-separated env var (via _convert_value_type)
+    if isinstance(value, list):
+        return tuple(value)
+    return _DEFAULT_FAILURE_TYPES
+
+
+def _job_templates(value: Any) -> Mapping[str, int]:
+    """Convert job template IDs to int and expose them read-only."""
+    return MappingProxyType({key: int(template_id) for key, template_id in value.items()})
+
+
+# Top-level sections that must be present in the config file
+_REQUIRED_SECTIONS = ('plc', 'tags')
+
+# Fields every tag entry must define
+_REQUIRED_TAG_FIELDS = ('name', 'type', 'nominal', 'failure_condition')
+
+# failure_condition -> additional tag fields that condition requires
+_CONDITION_REQUIRED_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'equals': ('failure_value',),
+    'not_equals': ('failure_value',),
+    'outside_range': ('failure_threshold_low', 'failure_threshold_high'),
+    'below': ('failure_threshold_low',),
+    'above': ('failure_threshold_high',),
+}
+
+# Tag value fields compared against PLC readings, and the conversion for
+# each tag type used when they are given as strings (e.g. quoted in YAML)
+_TAG_VALUE_FIELDS = ('nominal', 'failure_value', 'failure_threshold_low', 'failure_threshold_high')
+_TAG_VALUE_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    'bool': _to_bool,
+    'int': int,
+    'float': float,
+}
+
+# Marks a field that has no default and must be present in the section
+_REQUIRED = object()
+
+# Section name -> (dataclass, [(field name, coercion, default), ...])
+_SECTION_SCHEMA: Dict[str, Tuple[type, List[Tuple[str, Callable[[Any], Any], Any]]]] = {
+    'plc': (PLCConfig, [
+        ('ip_address', str, _REQUIRED),
+        ('slot', int, 0),
+        ('timeout', float, 5.0),
+        ('poll_interval_ms', int, 1000),
+        ('mock_mode', _to_bool, False),
+        ('protocol_mode', _protocol_mode, 'default'),
+        ('read_cache_ms', int, 0),
+        ('inter_read_delay_ms', int, 0),
+    ]),
+    'aap': (AAPConfig, [
+        ('enabled', _to_bool, True),
+        ('mock_mode', _to_bool, True),
+        ('base_url', str, ''),
+        ('verify_ssl', _to_bool, True),
+        ('token', str, ''),
+        ('job_templates', _job_templates, {}),
+    ]),
+    'remediation': (RemediationConfig, [
+        ('auto_remediate', _to_bool, False),
+        ('cooldown_seconds', int, 30),
+        ('max_retries', int, 3),
+    ]),
+    'chaos': (ChaosConfig, [
+        ('enabled', _to_bool, False),
+        ('failure_injection_rate', float, 0.05),
+        ('failure_types', _failure_types, None),
+        ('network_timeout_ms', int, 5000),
+        ('anomaly_duration_seconds', int, 10),
+    ]),
+    'dashboard': (DashboardConfig, [
+        ('refresh_interval_ms', int, 1000),
+        ('history_retention_hours', int, 24),
+        ('chart_data_points', int, 100),
+    ]),
+    'logging': (LoggingConfig, [
+        ('level', _log_level, 'INFO'),
+        ('format', str, '%(asctime)s - %(name)s - %(levelname)s - %(message)s'),
+    ]),
+}
+
+
+# Parsed configs keyed by (resolved path, mtime_ns, size, referenced env values),
+# most recently used last. ${VAR} substitution makes the result depend on the
+# environment too, but only on the variables the file references
+_LOAD_CACHE: "OrderedDict[Tuple[str, int, int, Tuple[Optional[str], ...]], AppConfig]" = OrderedDict()
+_LOAD_CACHE_MAX_ENTRIES = 8
+
+# (resolved path, mtime_ns, size) -> names of the ${VAR}s that file version
+# references, collected while it was first substituted
+_ENV_REFS: "OrderedDict[Tuple[str, int, int], Tuple[str, ...]]" = OrderedDict()
+
+
 class ConfigLoader:
     """Load and validate configuration from YAML file."""
 
@@ -105,7 +350,8 @@ class ConfigLoader:
         self.config_path = Path(config_path)
         self._config: Optional[AppConfig] = None
 
-    def _substitute_env_vars(self, text: str) -> str:
+    def _substitute_env_vars(self, text: str,
+                             env: Optional[Mapping[str, str]] = None) -> Tuple[str, bool]:
         """Substitute environment variables in format ${VAR_NAME} or ${VAR_NAME:-default}.
 
         Supports shell-style default values: ${VAR_NAME:-default_value}
@@ -113,29 +359,18 @@ class ConfigLoader:
 
         Args:
             text: String potentially containing ${VAR_NAME} or ${VAR_NAME:-default} patterns
+            env: Environment snapshot to resolve from (defaults to os.environ)
 
         Returns:
-            String with environment variables substituted
+            Tuple of (substituted string, whether any ${...} pattern was found)
         """
-        def replace_var(match):
-            var_expr = match.group(1)  # e.g., "VAR_NAME" or "VAR_NAME:-default"
-
-            # Check if default value is specified
-            if ':-' in var_expr:
-                var_name, default_value = var_expr.split(':-', 1)
-                var_name = var_name.strip()
-                default_value = default_value.strip()
-                return os.getenv(var_name, default_value)
-            else:
-                var_name = var_expr.strip()
-                env_value = os.getenv(var_name)
-                if env_value is not None:
-                    return env_value
-                # Return original pattern if not found (for backward compatibility)
-                return match.group(0)
-
-        pattern = r'\$\{([^}]+)\}'
-        return re.sub(pattern, replace_var, text)
+        # Cheap substring scan avoids the regex engine for most config strings
+        if '${' not in text:
+            return text, False
+
+        environ = os.environ if env is None else env
+        substituted, count = _ENV_VAR_RE.subn(lambda match: _replace_env_var(match, environ), text)
+        return substituted, count > 0
 
     def _convert_value_type(self, value: Any) -> Any:
         """Convert string value to appropriate type based on context.
@@ -183,41 +418,49 @@ class ConfigLoader:
         # Return as string if no conversion applies
         return value
 
-    def _substitute_in_dict(self, data: Any) -> Any:
-        """Recursively substitute environment variables in dict/list/str values.
+    def _substitute_in_dict(self, data: Any, env: Optional[Mapping[str, str]] = None) -> Any:
+        """Substitute environment variables in dict/list/str values.
 
-        After substitution, attempts type conversion for common cases.
+        Containers are walked iteratively and updated in place, so only
+        strings holding a ${...} reference are replaced. Those are
+        type-converted after substitution; values PyYAML already typed are
+        left as-is.
 
         Args:
             data: Data structure (dict, list, str, or other)
+            env: Environment snapshot to resolve from (defaults to os.environ)
 
         Returns:
             Data structure with environment variables substituted and types converted
         """
-        if isinstance(data, dict):
-            result = {}
-            for k, v in data.items():
-                substituted = self._substitute_in_dict(v)
-                # Convert value if it's a string that looks like a boolean/number/list
-                if isinstance(substituted, str):
-                    converted = self._convert_value_type(substituted)
-                    result[k] = converted
-                else:
-                    result[k] = substituted
-            return result
-        elif isinstance(data, list):
-            return [self._substitute_in_dict(item) for item in data]
-        elif isinstance(data, str):
-            substituted = self._substitute_env_vars(data)
-            # Convert if substitution occurred or if it's a simple value that needs conversion
-            converted = self._convert_value_type(substituted)
-            return converted
-        else:
+        if isinstance(data, str):
+            substituted, changed = self._substitute_env_vars(data, env)
+            # Only env-var results need coercion; YAML-native strings stay strings
+            return self._convert_value_type(substituted) if changed else substituted
+
+        if not isinstance(data, (dict, list)):
             return data
 
-    def _load_yaml(self) -> Dict[str, Any]:
+        pending = deque([data])
+        while pending:
+            container = pending.pop()
+            items = container.items() if isinstance(container, dict) else enumerate(container)
+            for key, value in items:
+                if isinstance(value, str):
+                    if '${' in value:
+                        # Replacing an existing key/index does not resize the container
+                        container[key] = self._substitute_in_dict(value, env)
+                elif isinstance(value, (dict, list)):
+                    pending.append(value)
+
+        return data
+
+    def _load_yaml(self, env: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
         """Load YAML file and substitute environment variables.
 
+        Args:
+            env: Environment snapshot to resolve from (defaults to a copy of os.environ)
+
         Returns:
             Parsed YAML as dictionary
 
@@ -228,51 +471,51 @@ class ConfigLoader:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
-        with open(self.config_path, 'r') as f:
-            raw_data = yaml.safe_load(f)
+        # Imported here so importing app.config (dataclasses only) stays cheap
+        import yaml
+
+        # Prefer the libyaml-backed loader when PyYAML was built with it
+        safe_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+        # Binary mode lets the YAML reader decode UTF-8 itself instead of
+        # going through TextIOWrapper
+        with open(self.config_path, 'rb') as f:
+            raw_data = yaml.load(f, Loader=safe_loader)
 
         if raw_data is None:
             raise ValueError("Configuration file is empty")
 
-        # Substitute environment variables
-        return self._substitute_in_dict(raw_data)
+        # Substitute environment variables from a single snapshot of the
+        # environment (a plain dict is cheaper to query than os.environ)
+        return self._substitute_in_dict(raw_data, dict(os.environ) if env is None else env)
 
-    def _validate_plc_config(self, plc_data: Dict[str, Any]) -> PLCConfig:
-        """Validate and create PLCConfig.
+    def _validate_section(self, section: str, section_data: Dict[str, Any]) -> Any:
+        """Validate a configuration section and create its dataclass.
+
+        Uses the field specs in _SECTION_SCHEMA, so every simple section is
+        handled by this one loop.
 
         Args:
-            plc_data: PLC configuration dictionary
+            section: Section name (key in _SECTION_SCHEMA)
+            section_data: Section configuration dictionary
 
         Returns:
-            Validated PLCConfig instance
+            Validated config dataclass instance for the section
 
         Raises:
-            ValueError: If required fields are missing or invalid
+            ValueError: If a required field is missing or a value is invalid
         """
-        if 'ip_address' not in plc_data:
-            raise ValueError("PLC configuration missing required field: ip_address")
-
-        # Validate protocol_mode
-        protocol_mode = str(plc_data.get('protocol_mode', 'default')).lower()
-        if protocol_mode not in ['default', 'serial']:
-            raise ValueError(
-                f"Invalid protocol_mode '{protocol_mode}'. Must be 'default' or 'serial'"
-            )
-
-        # Values should already be converted by _substitute_in_dict, but ensure proper types
-        slot_val = plc_data.get('slot', 0)
-        timeout_val = plc_data.get('timeout', 5.0)
-        poll_interval_val = plc_data.get('poll_interval_ms', 1000)
-        mock_mode_val = plc_data.get('mock_mode', False)
-
-        return PLCConfig(
-            ip_address=str(plc_data['ip_address']),
-            slot=int(slot_val) if not isinstance(slot_val, (int, bool)) else slot_val,
-            timeout=float(timeout_val) if not isinstance(timeout_val, (float, int)) else float(timeout_val),
-            poll_interval_ms=int(poll_interval_val) if not isinstance(poll_interval_val, int) else poll_interval_val,
-            mock_mode=bool(mock_mode_val) if not isinstance(mock_mode_val, bool) else mock_mode_val,
-            protocol_mode=protocol_mode
-        )
+        config_cls, fields = _SECTION_SCHEMA[section]
+        values = {}
+        for name, coerce, default in fields:
+            value = section_data.get(name, default)
+            if value is _REQUIRED:
+                raise ValueError(f"{section.upper()} configuration missing required field: {name}")
+            try:
+                values[name] = coerce(value)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid {section} configuration field '{name}': {e}") from e
+        return config_cls(**values)
 
     def _validate_tag_config(self, tag_name: str, tag_data: Dict[str, Any]) -> TagConfig:
         """Validate and create TagConfig.
@@ -287,173 +530,67 @@ class ConfigLoader:
         Raises:
             ValueError: If required fields are missing or invalid
         """
-        required_fields = ['name', 'type', 'nominal', 'failure_condition']
-        for field in required_fields:
-            if field not in tag_data:
-                raise ValueError(f"Tag '{tag_name}' missing required field: {field}")
-
-        failure_condition = tag_data['failure_condition']
+        for field_name in _REQUIRED_TAG_FIELDS:
+            if field_name not in tag_data:
+                raise ValueError(f"Tag '{tag_name}' missing required field: {field_name}")
 
         # Validate failure_condition-specific fields
-        if failure_condition in ['equals', 'not_equals']:
-            if 'failure_value' not in tag_data:
-                raise ValueError(
-                    f"Tag '{tag_name}' with condition '{failure_condition}' "
-                    "requires 'failure_value' field"
-                )
-        elif failure_condition == 'outside_range':
-            if 'failure_threshold_low' not in tag_data or 'failure_threshold_high' not in tag_data:
-                raise ValueError(
-                    f"Tag '{tag_name}' with condition 'outside_range' "
-                    "requires 'failure_threshold_low' and 'failure_threshold_high' fields"
-                )
-        elif failure_condition in ['below', 'above']:
-            threshold_key = f"failure_threshold_{failure_condition}"
-            if threshold_key not in tag_data:
-                raise ValueError(
-                    f"Tag '{tag_name}' with condition '{failure_condition}' "
-                    f"requires '{threshold_key}' field"
-                )
+        failure_condition = tag_data['failure_condition']
+        condition_fields = _CONDITION_REQUIRED_FIELDS.get(failure_condition, ())
+        if not all(field_name in tag_data for field_name in condition_fields):
+            field_list = " and ".join(f"'{field_name}'" for field_name in condition_fields)
+            plural = "s" if len(condition_fields) > 1 else ""
+            raise ValueError(
+                f"Tag '{tag_name}' with condition '{failure_condition}' "
+                f"requires {field_list} field{plural}"
+            )
 
+        # Threshold predicates compare readings against these values, so
+        # quoted numbers must be converted to the tag's type here
+        tag_type = str(tag_data['type'])
+        values = {field_name: tag_data.get(field_name) for field_name in _TAG_VALUE_FIELDS}
+        converter = _TAG_VALUE_CONVERTERS.get(tag_type)
+        if converter is not None:
+            for field_name, value in values.items():
+                if isinstance(value, str):
+                    try:
+                        values[field_name] = converter(value)
+                    except ValueError as e:
+                        raise ValueError(
+                            f"Tag '{tag_name}' field '{field_name}' is not a valid {tag_type}: {e}"
+                        ) from e
+
+        # Tag names are repeated as dict keys throughout the monitoring
+        # pipeline; interning lets lookups match by identity
         return TagConfig(
-            name=str(tag_data['name']),
-            type=str(tag_data['type']),
-            nominal=tag_data['nominal'],
+            name=sys.intern(str(tag_data['name'])),
+            type=tag_type,
             failure_condition=str(tag_data['failure_condition']),
-            failure_value=tag_data.get('failure_value'),
-            failure_threshold_low=tag_data.get('failure_threshold_low'),
-            failure_threshold_high=tag_data.get('failure_threshold_high')
-        )
-
-    def _validate_aap_config(self, aap_data: Dict[str, Any]) -> AAPConfig:
-        """Validate and create AAPConfig.
-
-        Args:
-            aap_data: AAP configuration dictionary
-
-        Returns:
-            Validated AAPConfig instance
-        """
-        # Convert job templates values to int
-        job_templates = {}
-        for key, value in aap_data.get('job_templates', {}).items():
-            job_templates[key] = int(value) if not isinstance(value, int) else value
-
-        enabled_val = aap_data.get('enabled', True)
-        mock_mode_val = aap_data.get('mock_mode', True)
-        verify_ssl_val = aap_data.get('verify_ssl', True)
-
-        return AAPConfig(
-            enabled=bool(enabled_val) if not isinstance(enabled_val, bool) else enabled_val,
-            mock_mode=bool(mock_mode_val) if not isinstance(mock_mode_val, bool) else mock_mode_val,
-            base_url=str(aap_data.get('base_url', '')),
-            verify_ssl=bool(verify_ssl_val) if not isinstance(verify_ssl_val, bool) else verify_ssl_val,
-            token=str(aap_data.get('token', '')),
-            job_templates=job_templates
-        )
-
-    def _validate_remediation_config(self, remediation_data: Dict[str, Any]) -> RemediationConfig:
-        """Validate and create RemediationConfig.
-
-        Args:
-            remediation_data: Remediation configuration dictionary
-
-        Returns:
-            Validated RemediationConfig instance
-        """
-        auto_remediate_val = remediation_data.get('auto_remediate', False)
-        cooldown_val = remediation_data.get('cooldown_seconds', 30)
-        max_retries_val = remediation_data.get('max_retries', 3)
-
-        return RemediationConfig(
-            auto_remediate=bool(auto_remediate_val) if not isinstance(auto_remediate_val, bool) else auto_remediate_val,
-            cooldown_seconds=int(cooldown_val) if not isinstance(cooldown_val, int) else cooldown_val,
-            max_retries=int(max_retries_val) if not isinstance(max_retries_val, int) else max_retries_val
-        )
-
-    def _validate_chaos_config(self, chaos_data: Dict[str, Any]) -> ChaosConfig:
-        """Validate and create ChaosConfig.
-
-        Args:
-            chaos_data: Chaos configuration dictionary
-
-        Returns:
-            Validated ChaosConfig instance
-        """
-        enabled_val = chaos_data.get('enabled', False)
-        failure_injection_rate_val = chaos_data.get('failure_injection_rate', 0.05)
-        failure_types_val = chaos_data.get('failure_types', [
-            "value_anomaly", "network_timeout", "connection_loss", "service_crash"
-        ])
-        network_timeout_val = chaos_data.get('network_timeout_ms', 5000)
-        anomaly_duration_val = chaos_data.get('anomaly_duration_seconds', 10)
-
-        # Handle failure_types - could be a list or comma-separated string (already converted by _substitute_in_dict)
-        if isinstance(failure_types_val, list):
-            failure_types_list = failure_types_val
-        else:
-            # Fallback for non-list values
-            failure_types_list = [
-                "value_anomaly", "network_timeout", "connection_loss", "service_crash"
-            ]
-
-        return ChaosConfig(
-            enabled=bool(enabled_val) if not isinstance(enabled_val, bool) else enabled_val,
-            failure_injection_rate=float(failure_injection_rate_val) if not isinstance(failure_injection_rate_val, (float, int)) else float(failure_injection_rate_val),
-            failure_types=failure_types_list,
-            network_timeout_ms=int(network_timeout_val) if not isinstance(network_timeout_val, int) else network_timeout_val,
-            anomaly_duration_seconds=int(anomaly_duration_val) if not isinstance(anomaly_duration_val, int) else anomaly_duration_val
+            **values
         )
 
-    def _validate_dashboard_config(self, dashboard_data: Dict[str, Any]) -> DashboardConfig:
-        """Validate and create DashboardConfig.
-
-        Args:
-            dashboard_data: Dashboard configuration dictionary
-
-        Returns:
-            Validated DashboardConfig instance
-        """
-        refresh_interval_val = dashboard_data.get('refresh_interval_ms', 1000)
-        history_retention_val = dashboard_data.get('history_retention_hours', 24)
-        chart_data_points_val = dashboard_data.get('chart_data_points', 100)
-
-        return DashboardConfig(
-            refresh_interval_ms=int(refresh_interval_val) if not isinstance(refresh_interval_val, int) else refresh_interval_val,
-            history_retention_hours=int(history_retention_val) if not isinstance(history_retention_val, int) else history_retention_val,
-            chart_data_points=int(chart_data_points_val) if not isinstance(chart_data_points_val, int) else chart_data_points_val
-        )
-
-    def _validate_logging_config(self, logging_data: Dict[str, Any]) -> LoggingConfig:
-        """Validate and create LoggingConfig.
-
-        Args:
-            logging_data: Logging configuration dictionary
+    def _file_key(self) -> Optional[Tuple[str, int, int]]:
+        """Identify the current version of the config file with a single stat().
 
         Returns:
-            Validated LoggingConfig instance
-
-        Raises:
-            ValueError: If log level is invalid
+            (resolved path, mtime_ns, size), or None if the file can't be stat'ed
         """
-        level = str(logging_data.get('level', 'INFO')).upper()
-        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-
-        if level not in valid_levels:
-            raise ValueError(
-                f"Invalid log level '{level}'. Must be one of: {', '.join(valid_levels)}"
-            )
-
-        log_format = str(logging_data.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-
-        return LoggingConfig(
-            level=level,
-            format=log_format
-        )
+        try:
+            resolved = self.config_path.resolve()
+            stat = resolved.stat()
+        except OSError:
+            # Missing/unreadable file - let _load_yaml() raise the usual error
+            return None
+        return (str(resolved), stat.st_mtime_ns, stat.st_size)
 
     def load(self) -> AppConfig:
         """Load and validate configuration.
 
+        Loading an unchanged file again returns the previously parsed
+        AppConfig as long as the environment variables it references are
+        unchanged; any change to the file's mtime or size, or to one of those
+        variables, forces a reparse.
+
         Returns:
             Validated AppConfig instance
 
@@ -461,32 +598,43 @@ class ConfigLoader:
             FileNotFoundError: If config file doesn't exist
             ValueError: If configuration is invalid
         """
-        data = self._load_yaml()
+        file_key = self._file_key()
+        names = _ENV_REFS.get(file_key) if file_key is not None else None
+        if names is not None:
+            cache_key = file_key + (tuple(os.environ.get(name) for name in names),)
+            cached = _LOAD_CACHE.get(cache_key)
+            if cached is not None:
+                _LOAD_CACHE.move_to_end(cache_key)
+                self._config = cached
+                return cached
+
+        environ = _RecordingEnviron(os.environ)
+        data = self._load_yaml(environ)
 
         # Validate required sections
-        if 'plc' not in data:
-            raise ValueError("Configuration missing required section: plc")
-        if 'tags' not in data:
-            raise ValueError("Configuration missing required section: tags")
+        for section in _REQUIRED_SECTIONS:
+            if section not in data:
+                raise ValueError(f"Configuration missing required section: {section}")
         if not data['tags']:
             raise ValueError("Configuration must define at least one tag")
 
         # Build configuration objects
-        plc_config = self._validate_plc_config(data['plc'])
+        plc_config = self._validate_section('plc', data['plc'])
 
-        tags_config = {}
-        for tag_name, tag_data in data['tags'].items():
-            tags_config[tag_name] = self._validate_tag_config(tag_name, tag_data)
+        tags_config = {
+            sys.intern(str(tag_name)): self._validate_tag_config(tag_name, tag_data)
+            for tag_name, tag_data in data['tags'].items()
+        }
 
-        aap_config = self._validate_aap_config(data.get('aap', {}))
-        remediation_config = self._validate_remediation_config(data.get('remediation', {}))
-        chaos_config = self._validate_chaos_config(data.get('chaos', {}))
-        dashboard_config = self._validate_dashboard_config(data.get('dashboard', {}))
-        logging_config = self._validate_logging_config(data.get('logging', {}))
+        aap_config = self._validate_section('aap', data.get('aap', {}))
+        remediation_config = self._validate_section('remediation', data.get('remediation', {}))
+        chaos_config = self._validate_section('chaos', data.get('chaos', {}))
+        dashboard_config = self._validate_section('dashboard', data.get('dashboard', {}))
+        logging_config = self._validate_section('logging', data.get('logging', {}))
 
         self._config = AppConfig(
             plc=plc_config,
-            tags=tags_config,
+            tags=MappingProxyType(tags_config),
             aap=aap_config,
             remediation=remediation_config,
             chaos=chaos_config,
@@ -494,6 +642,16 @@ class ConfigLoader:
             logging=logging_config
         )
 
+        if file_key is not None:
+            _ENV_REFS[file_key] = tuple(environ.lookups)
+            _ENV_REFS.move_to_end(file_key)
+            if len(_ENV_REFS) > _LOAD_CACHE_MAX_ENTRIES:
+                _ENV_REFS.popitem(last=False)
+
+            _LOAD_CACHE[file_key + (tuple(environ.lookups.values()),)] = self._config
+            if len(_LOAD_CACHE) > _LOAD_CACHE_MAX_ENTRIES:
+                _LOAD_CACHE.popitem(last=False)
+
         return self._config
 
     def get_config(self) -> AppConfig:
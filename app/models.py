@@ -1,8 +1,73 @@
 """Data models for PLC Self-Healing Middleware."""
+import json
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Mapping, Optional, List
+
+# orjson is optional; fall back to the stdlib encoder when it isn't installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Encode values the JSON encoder has no native support for.
+
+    orjson serializes the model dataclasses, enums and naive datetimes
+    itself; this covers read-only mappings and, for the stdlib fallback,
+    the models (via to_dict), enums and datetimes.
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj (which may contain model instances) to UTF-8 JSON bytes.
+
+    With orjson, dataclass models are encoded directly without building the
+    intermediate dict from to_dict().
+
+    Args:
+        obj: Value to serialize
+
+    Returns:
+        JSON document as bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_orjson_default)
+    return json.dumps(obj, default=_orjson_default).encode('utf-8')
+
+
+class JSONCodec:
+    """json-module compatible codec for Flask-SocketIO packet encoding.
+
+    Socket.IO encodes each emitted packet once for all recipients; this
+    makes that single encoding go through dumps() (orjson when available).
+    Formatting keyword arguments are ignored since the output is already
+    compact.
+    """
+
+    @staticmethod
+    def dumps(obj: Any, *args, **kwargs) -> str:
+        return dumps(obj).decode('utf-8')
+
+    @staticmethod
+    def loads(s, *args, **kwargs) -> Any:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(s)
+        return json.loads(s)
 
 
 class EventType(Enum):
@@ -34,7 +99,15 @@ class RemediationStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# Cache each member's value as a plain (interned) instance attribute so the
+# to_dict() serializers skip the Enum.value descriptor on every call
+for _enum_cls in (EventType, Severity, RemediationStatus):
+    for _member in _enum_cls:
+        _member.v = sys.intern(_member.value)
+del _enum_cls, _member
+
+
+@dataclass(slots=True)
 class TagResult:
     """Result of a PLC tag read operation."""
     tag_name: str
@@ -42,21 +115,36 @@ class TagResult:
     timestamp: datetime
     success: bool
     error: Optional[str] = None
+    _timestamp_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def timestamp_iso(self) -> str:
+        """Return the ISO-8601 timestamp, formatting it only on first use."""
+        if self._timestamp_iso is None:
+            self._timestamp_iso = self.timestamp.isoformat()
+        return self._timestamp_iso
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
             'tag_name': self.tag_name,
             'value': self.value,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp_iso(),
             'success': self.success,
             'error': self.error
         }
 
+    def to_json(self) -> bytes:
+        """Serialize to UTF-8 JSON bytes (same shape as to_dict)."""
+        return dumps(self)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ConnectionStats:
-    """PLC connection statistics."""
+    """PLC connection statistics.
+
+    Immutable: PLCClient replaces the whole object on every update and hands
+    the current snapshot to callers without copying it.
+    """
     connected: bool
     last_successful_read: Optional[datetime] = None
     total_reads: int = 0
@@ -81,8 +169,12 @@ class ConnectionStats:
             'last_error': self.last_error
         }
 
+    def to_json(self) -> bytes:
+        """Serialize to UTF-8 JSON bytes (same shape as to_dict)."""
+        return dumps(self)
+
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Application event."""
     event_type: EventType
@@ -90,19 +182,30 @@ class Event:
     data: Dict[str, Any]
     severity: Severity = Severity.INFO
     tag_name: Optional[str] = None
+    _timestamp_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def timestamp_iso(self) -> str:
+        """Return the ISO-8601 timestamp, formatting it only on first use."""
+        if self._timestamp_iso is None:
+            self._timestamp_iso = self.timestamp.isoformat()
+        return self._timestamp_iso
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
-            'event_type': self.event_type.value,
-            'timestamp': self.timestamp.isoformat(),
+            'event_type': self.event_type.v,
+            'timestamp': self.timestamp_iso(),
             'data': self.data,
-            'severity': self.severity.value,
+            'severity': self.severity.v,
             'tag_name': self.tag_name
         }
 
+    def to_json(self) -> bytes:
+        """Serialize to UTF-8 JSON bytes (same shape as to_dict)."""
+        return dumps(self)
+
 
-@dataclass
+@dataclass(slots=True)
 class RemediationJob:
     """Remediation job tracking."""
     job_id: str
@@ -118,15 +221,19 @@ class RemediationJob:
         return {
             'job_id': self.job_id,
             'action_type': self.action_type,
-            'status': self.status.value,
+            'status': self.status.v,
             'start_time': self.start_time.isoformat(),
             'end_time': self.end_time.isoformat() if self.end_time else None,
             'error_message': self.error_message,
             'aap_job_id': self.aap_job_id
         }
 
+    def to_json(self) -> bytes:
+        """Serialize to UTF-8 JSON bytes (same shape as to_dict)."""
+        return dumps(self)
 
-@dataclass
+
+@dataclass(slots=True)
 class MetricSnapshot:
     """Aggregated metrics at a point in time."""
     timestamp: datetime
@@ -151,8 +258,12 @@ class MetricSnapshot:
             'tag_values': self.tag_values
         }
 
+    def to_json(self) -> bytes:
+        """Serialize to UTF-8 JSON bytes (same shape as to_dict)."""
+        return dumps(self)
+
 
-@dataclass
+@dataclass(slots=True)
 class ThresholdViolation:
     """Threshold violation information."""
     tag_name: str
@@ -174,3 +285,7 @@ class ThresholdViolation:
             'resolved': self.resolved,
             'resolved_at': self.resolved_at.isoformat() if self.resolved_at else None
         }
+
+    def to_json(self) -> bytes:
+        """Serialize to UTF-8 JSON bytes (same shape as to_dict)."""
+        return dumps(self)
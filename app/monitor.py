@@ -1,11 +1,16 @@
 """Monitor service for continuous PLC polling and threshold detection."""
 import logging
+import queue
 import threading
 import time
+from array import array
 from collections import deque
+from itertools import islice
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from flask_socketio import SocketIO
+from socketio import PubSubManager
+from socketio.base_manager import BaseManager
 
 # Import eventlet for non-blocking sleep when using eventlet async mode
 try:
@@ -22,6 +27,59 @@ from app.plc_client import PLCClient
 
 logger = logging.getLogger(__name__)
 
+# Tag types whose history is kept in a typed ring buffer
+_NUMERIC_TAG_TYPES = frozenset(('int', 'float'))
+
+# Exact Python value type -> array typecode for _NumericRing
+_RING_TYPECODES = {int: 'q', float: 'd'}
+
+
+class _NumericRing:
+    """Fixed-capacity ring buffer of numbers backed by a typed array.
+
+    Iterates oldest to newest like a deque with maxlen. The array type is
+    picked from the first value (int or float) and every later value must
+    have exactly that type, so values come back as the type they were read
+    as. Appending any other value raises TypeError (or OverflowError for an
+    int the array cannot hold).
+    """
+
+    __slots__ = ('_capacity', '_type', '_data', '_head', '_size')
+
+    def __init__(self, capacity: int):
+        self._capacity = capacity
+        self._type: Optional[type] = None
+        self._data: Optional[array] = None
+        self._head = 0
+        self._size = 0
+
+    def append(self, value: Any) -> None:
+        data = self._data
+        if data is None:
+            # type() rather than isinstance(): bools must not be stored as ints
+            typecode = _RING_TYPECODES.get(type(value))
+            if typecode is None:
+                raise TypeError(f"unsupported ring value type: {type(value).__name__}")
+            data = self._data = array(typecode, [0]) * self._capacity
+            self._type = type(value)
+        elif type(value) is not self._type:
+            raise TypeError(f"ring holds {self._type.__name__}, got {type(value).__name__}")
+        data[self._head] = value
+        self._head = (self._head + 1) % len(data)
+        if self._size < len(data):
+            self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        data = self._data
+        if data is None:
+            return iter(())
+        if self._size < len(data):
+            return iter(data[:self._size])
+        return iter(data[self._head:] + data[:self._head])
+
 
 class MonitorService:
     """Service for monitoring PLC tags and detecting threshold violations."""
@@ -39,20 +97,55 @@ class MonitorService:
         self.socketio = socketio
 
         self._running = False
+        self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
-        self._lock = threading.Lock()
 
-        # Tag history storage (circular buffer)
-        self._tag_history: Dict[str, deque] = {}
+        # While running, events are handed to a separate emitter greenlet/thread
+        # through this queue so storing and Socket.IO emits never delay polling
+        self._emit_q: Optional[queue.Queue] = None
+        self._emitter: Optional[threading.Thread] = None
+        self._emit_queue_size = 10_000
+        self._emit_batch_size = 256
+        # Separate locks per piece of shared state so API readers only contend
+        # with the writer of the data they ask for (current values need none,
+        # see _current_values)
+        self._history_lock = threading.Lock()
+        self._events_lock = threading.Lock()
+        self._violations_lock = threading.Lock()
+
+        # Config is static after load, so resolve the PLC tag names to read and
+        # the PLC name -> config key mapping once instead of every poll
+        self._tag_names_to_read: List[str] = [tc.name for tc in config.tags.values()]
+        self._actual_to_key: Dict[str, str] = {tc.name: key for key, tc in config.tags.items()}
+
+        # Per-tag threshold evaluators returning (violation, reason)
+        self._evaluators: Dict[str, Callable[[Any], Tuple[bool, str]]] = {
+            key: self._build_evaluator(tc) for key, tc in config.tags.items()
+        }
+
+        # Tag history storage (circular buffers), kept as parallel buffers of
+        # ISO timestamps and raw values; dicts are only built by get_tag_history.
+        # Values of int/float tags live in typed ring buffers instead of deques
+        # of Python objects.
         max_history = config.dashboard.chart_data_points
-        for tag_name in config.tags.keys():
-            self._tag_history[tag_name] = deque(maxlen=max_history)
+        self._ts_history: Dict[str, deque] = {}
+        self._val_history: Dict[str, Any] = {}
+        for tag_name, tag_config in config.tags.items():
+            self._ts_history[tag_name] = deque(maxlen=max_history)
+            if tag_config.type in _NUMERIC_TAG_TYPES and max_history > 0:
+                self._val_history[tag_name] = _NumericRing(max_history)
+            else:
+                self._val_history[tag_name] = deque(maxlen=max_history)
 
-        # Event storage (circular buffer)
+        # Event storage (circular buffers): all events, plus one buffer per
+        # event type so filtered lookups don't scan the whole history
         self._events: deque = deque(maxlen=1000)
+        self._events_by_type: Dict[EventType, deque] = {et: deque(maxlen=1000) for et in EventType}
 
-        # Active violations tracking
+        # Active violations tracking; resolved violations are moved to a
+        # bounded history so the active dict only holds unresolved ones
         self._active_violations: Dict[str, ThresholdViolation] = {}
+        self._resolved_history: deque = deque(maxlen=500)
 
         # Track consecutive normal readings before resolving violations (stability period)
         # Require 3 consecutive normal readings before resolving a violation
@@ -65,11 +158,18 @@ class MonitorService:
         self._base_poll_interval = config.plc.poll_interval_ms / 1000.0
         self._current_poll_interval = self._base_poll_interval
 
-        # Current tag values
+        # Current tag values. The monitor loop publishes a new dict each cycle
+        # and never mutates a published one, so readers can use it lock-free
         self._current_values: Dict[str, TagResult] = {}
 
+        # Last emitted TAG_READ per tag as (monotonic time, value); unchanged
+        # values are re-emitted at most once per interval
+        self._last_emitted: Dict[str, Tuple[float, Any]] = {}
+        self._tag_read_emit_interval = 1.0
+
         # Statistics
         self._start_time = datetime.now()
+        self._start_monotonic = time.monotonic()  # Uptime clock, immune to wall-clock jumps
         self._total_reads = 0
         self._total_violations = 0
         self._last_connection_state = False
@@ -80,6 +180,25 @@ class MonitorService:
         # Remediation trigger hook (set by app initialization)
         self._remediation_hook: Optional[Callable[[str], None]] = None
 
+        # Last auto-remediation decision per tag as (auto_remediate, hook set);
+        # the check is logged at INFO only when this changes
+        self._remediation_decisions: Dict[str, Tuple[bool, bool]] = {}
+
+    def _has_ws_clients(self) -> bool:
+        """Check whether any Socket.IO client can receive an emit.
+
+        Asks the server's client manager instead of counting connects. A
+        message-queue manager only knows this worker's clients, so it is
+        always treated as having listeners.
+
+        Returns:
+            True if an emit may reach a client
+        """
+        manager = getattr(getattr(self.socketio, 'server', None), 'manager', None)
+        if not isinstance(manager, BaseManager) or isinstance(manager, PubSubManager):
+            return True
+        return next(manager.get_participants('/', None), None) is not None
+
     def set_chaos_hook(self, hook: Callable[[str, Any], Any]) -> None:
         """Set chaos injection hook.
 
@@ -104,11 +223,20 @@ class MonitorService:
             return
 
         self._running = True
+        self._stop_event.clear()
+
+        # Start the emitter first so the initial connection event goes through it
+        self._emit_q = (eventlet.queue.Queue if EVENTLET_AVAILABLE else queue.Queue)(
+            maxsize=self._emit_queue_size)
+        if EVENTLET_AVAILABLE:
+            self._emitter = eventlet.spawn(self._emitter_loop, self._emit_q)
+        else:
+            self._emitter = threading.Thread(target=self._emitter_loop, args=(self._emit_q,), daemon=True)
+            self._emitter.start()
 
         # Emit initial connection state (check outside any locks)
         initial_connected = self.plc_client.is_connected()
-        with self._lock:
-            self._last_connection_state = initial_connected
+        self._last_connection_state = initial_connected
         if initial_connected:
             self._emit_event(EventType.CONNECTION_RESTORED, {
                 'message': 'PLC connection established'
@@ -134,21 +262,58 @@ class MonitorService:
             return
 
         self._running = False
-        if self._thread:
-            if EVENTLET_AVAILABLE and hasattr(self._thread, 'kill'):
+        self._stop_event.set()  # Wake the loop if it is waiting for the next poll
+        for worker in (self._thread, self._emitter):
+            if not worker:
+                continue
+            if EVENTLET_AVAILABLE and hasattr(worker, 'kill'):
                 # eventlet greenlet
                 try:
-                    self._thread.kill()
+                    worker.kill()
                 except Exception:
                     pass
             else:
                 # regular thread
-                self._thread.join(timeout=5.0)
+                worker.join(timeout=5.0)
+
+        # Store/emit whatever the emitter had not picked up yet
+        emit_q, self._emit_q = self._emit_q, None
+        self._emitter = None
+        if emit_q is not None:
+            self._process_emits(self._drain(emit_q, emit_q.qsize()))
         logger.info("Monitor service stopped")
 
+    def _emitter_loop(self, emit_q: queue.Queue) -> None:
+        """Store and emit queued events in batches until stopped.
+
+        Args:
+            emit_q: Queue filled by _dispatch_events
+        """
+        while not self._stop_event.is_set():
+            try:
+                first = emit_q.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            batch = [first] + self._drain(emit_q, self._emit_batch_size - 1)
+            try:
+                self._process_emits(batch)
+            except Exception as e:
+                logger.error(f"Error in event emitter: {e}", exc_info=True)
+
+    @staticmethod
+    def _drain(emit_q: queue.Queue, limit: int) -> List[tuple]:
+        """Take up to limit queued items without blocking."""
+        items = []
+        while len(items) < limit:
+            try:
+                items.append(emit_q.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
     def _monitor_loop(self) -> None:
         """Main monitoring loop."""
-        while self._running:
+        while not self._stop_event.is_set():
             try:
                 poll_start = time.time()
                 self._poll_cycle()
@@ -179,25 +344,21 @@ class MonitorService:
 
             # Sleep until next poll using adaptive interval
             # Use eventlet.sleep if available to avoid blocking HTTP requests
+            # (the greenlet is killed on stop); a plain thread waits on the stop
+            # event so stop() interrupts the wait immediately
             if EVENTLET_AVAILABLE:
                 eventlet.sleep(self._current_poll_interval)
             else:
-                time.sleep(self._current_poll_interval)
+                self._stop_event.wait(self._current_poll_interval)
 
     def _poll_cycle(self) -> None:
         """Execute one polling cycle."""
         poll_cycle_start = time.time()
+        cycle_now = datetime.now()  # Shared timestamp for every event from this cycle
+        debug = logger.isEnabledFor(logging.DEBUG)  # Skip building debug messages when they'd be dropped
         results = {}  # Initialize results to empty dict in case of early return
-        tag_mapping = {}  # Maps config key -> actual PLC tag name
 
         try:
-            # Get actual PLC tag names from config (not the config keys)
-            tag_names = []  # List of actual PLC tag names to read
-            for config_key, tag_config in self.config.tags.items():
-                actual_tag_name = tag_config.name  # Use the 'name' field from config
-                tag_mapping[actual_tag_name] = config_key  # Reverse mapping for results
-                tag_names.append(actual_tag_name)
-
             # Check connection health before attempting reads
             if not self.plc_client.check_connection_health():
                 logger.warning("PLC connection health check failed in poll cycle, attempting reconnect")
@@ -208,8 +369,9 @@ class MonitorService:
             # Read all tags using actual PLC tag names (OUTSIDE the lock to avoid blocking API requests)
             # Wrap in try-except to prevent blocking on read failures
             try:
-                results = self.plc_client.read_tags(tag_names)
-                logger.debug(f"Read tags results: {[(k, v.success, v.value if v.success else v.error) for k, v in results.items()]}")
+                results = self.plc_client.read_tags(self._tag_names_to_read, timestamp=cycle_now)
+                if debug:
+                    logger.debug(f"Read tags results: {[(k, v.success, v.value if v.success else v.error) for k, v in results.items()]}")
             except Exception as e:
                 logger.error(f"Error reading tags in poll cycle: {e}", exc_info=True)
                 # Continue with empty results to avoid blocking
@@ -226,12 +388,10 @@ class MonitorService:
             pass
 
         # Map results back to config keys for internal storage
-        mapped_results = {}
-        for actual_tag_name, result in results.items():
-            config_key = tag_mapping.get(actual_tag_name, actual_tag_name)
-            mapped_results[config_key] = result
-        results = mapped_results
-        logger.debug(f"Mapped results to config keys: {list(results.keys())}")
+        actual_to_key = self._actual_to_key
+        results = {actual_to_key.get(name, name): result for name, result in results.items()}
+        if debug:
+            logger.debug(f"Mapped results to config keys: {list(results.keys())}")
 
         # Prepare events to emit (outside lock)
         events_to_emit = []
@@ -239,40 +399,63 @@ class MonitorService:
         # Prepare data outside lock
         values_to_store = {}
         history_entries = {}
-        threshold_evaluations = []
+        threshold_results = []
+
+        # Loop-invariant lookups hoisted out of the per-tag loop
+        evaluators = self._evaluators
+        chaos_hook = self._chaos_hook
+
+        # Reads from one batch usually share a timestamp; format it once
+        last_timestamp = None
+        last_timestamp_iso = None
 
         for tag_name, result in results.items():
             try:
-                logger.debug(f"Processing tag {tag_name}, success={result.success}, value={result.value if result.success else result.error}")
+                if debug:
+                    logger.debug(f"Processing tag {tag_name}, success={result.success}, value={result.value if result.success else result.error}")
                 values_to_store[tag_name] = result
 
                 if result.success:
                     # Prepare history entry
-                    history_entries[tag_name] = {
-                        'timestamp': result.timestamp.isoformat(),
-                        'value': result.value
-                    }
+                    timestamp = result.timestamp
+                    if timestamp != last_timestamp:
+                        last_timestamp = timestamp
+                        last_timestamp_iso = timestamp.isoformat()
+                    history_entries[tag_name] = (last_timestamp_iso, result.value)
 
                     # Apply chaos injection if enabled
                     value = result.value
-                    if self._chaos_hook:
+                    if chaos_hook:
                         try:
-                            value = self._chaos_hook(tag_name, value)
+                            value = chaos_hook(tag_name, value)
                         except Exception as e:
                             logger.warning(f"Chaos hook error for {tag_name}: {e}")
 
-                    # Prepare threshold evaluation (will do outside lock)
-                    threshold_evaluations.append((tag_name, value, result.timestamp))
-
-                    # Queue event to emit
-                    events_to_emit.append((EventType.TAG_READ, {
-                        'tag_name': tag_name,
-                        'value': value,
-                        'success': True
-                    }, Severity.INFO, tag_name))
+                    # Classify against the threshold now (pure, no locks); the
+                    # violation state is updated for all tags at once below
+                    evaluator = evaluators.get(tag_name)
+                    if evaluator is not None:
+                        threshold_results.append((tag_name, value, result.timestamp) + evaluator(value))
+                    else:
+                        self._classify_threshold(tag_name, value)  # Logs the unknown tag
+
+                    # Queue event to emit, unless the value is unchanged and
+                    # was already emitted within the last interval
+                    now = time.monotonic()
+                    last = self._last_emitted.get(tag_name)
+                    if (last is None or last[1] != value
+                            or now - last[0] >= self._tag_read_emit_interval):
+                        self._last_emitted[tag_name] = (now, value)
+                        events_to_emit.append((EventType.TAG_READ, {
+                            'tag_name': tag_name,
+                            'value': value,
+                            'success': True
+                        }, Severity.INFO, tag_name))
                 else:
-                    # Queue error event
-                    logger.debug(f"Tag {tag_name} read failed: {result.error}")
+                    # Queue error event; the next good read is always emitted
+                    if debug:
+                        logger.debug(f"Tag {tag_name} read failed: {result.error}")
+                    self._last_emitted.pop(tag_name, None)
                     events_to_emit.append((EventType.TAG_READ, {
                         'tag_name': tag_name,
                         'error': result.error
@@ -280,27 +463,35 @@ class MonitorService:
             except Exception as e:
                 logger.error(f"Error processing tag {tag_name}: {e}", exc_info=True)
 
-        # Update shared state quickly inside lock (minimize lock time)
-        with self._lock:
-            for tag_name, result in values_to_store.items():
-                self._current_values[tag_name] = result
-                self._total_reads += 1
+        # Update shared state quickly inside the locks (minimize lock time)
+        if values_to_store:
+            self._current_values = {**self._current_values, **values_to_store}
+        # Counters are only written by the monitor loop; no lock needed
+        self._total_reads += len(values_to_store)
 
-            for tag_name, history_entry in history_entries.items():
-                self._tag_history[tag_name].append(history_entry)
-
-        # Evaluate thresholds OUTSIDE the lock (they will acquire lock internally if needed)
-        logger.debug(f"Evaluating thresholds for {len(threshold_evaluations)} tags: {[tn for tn, _, _ in threshold_evaluations]}")
-        for tag_name, value, timestamp in threshold_evaluations:
-            logger.debug(f"Calling _evaluate_threshold for tag_name='{tag_name}' (config key), value={value}")
-            self._evaluate_threshold(tag_name, value, timestamp)
+        with self._history_lock:
+            for tag_name, (timestamp_iso, value) in history_entries.items():
+                self._ts_history[tag_name].append(timestamp_iso)
+                values = self._val_history[tag_name]
+                try:
+                    values.append(value)
+                except (TypeError, OverflowError):
+                    # Value doesn't match the typed buffer's type; keep this
+                    # tag's history as plain objects from now on
+                    values = deque(values, maxlen=self._ts_history[tag_name].maxlen)
+                    values.append(value)
+                    self._val_history[tag_name] = values
+
+        # Apply all threshold results under a single lock acquisition
+        if debug:
+            logger.debug(f"Applying threshold results for {len(threshold_results)} tags: {[r[0] for r in threshold_results]}")
+        self._apply_threshold_results(threshold_results, now=cycle_now)
 
         # Check connection state changes OUTSIDE the lock to avoid blocking eventlet
         current_connected = self.plc_client.is_connected()
         if current_connected != self._last_connection_state:
-            with self._lock:
-                # Update state inside lock
-                self._last_connection_state = current_connected
+            # Only the monitor loop writes this, so no lock is needed
+            self._last_connection_state = current_connected
 
             # Queue event to emit (outside lock)
             if current_connected:
@@ -312,10 +503,15 @@ class MonitorService:
                     'message': 'PLC connection lost'
                 }, Severity.ERROR, None))
 
-        # Emit events outside the lock to avoid blocking
-        for event_type, data, severity, tag_name in events_to_emit:
-            logger.debug(f"Emitting {event_type.value} event for {tag_name} with data: {data}")
-            self._emit_event(event_type, data, severity, tag_name)
+        # Emit events outside the lock to avoid blocking. TAG_READ events are
+        # still stored individually but go out as one batched Socket.IO message
+        if debug:
+            for event_type, data, severity, tag_name in events_to_emit:
+                logger.debug(f"Emitting {event_type.value} event for {tag_name} with data: {data}")
+        self._dispatch_events([
+            (event_type, data, severity, tag_name, cycle_now, False)
+            for event_type, data, severity, tag_name in events_to_emit
+        ])
 
         # Log poll cycle performance
         poll_cycle_duration = time.time() - poll_cycle_start
@@ -332,89 +528,109 @@ class MonitorService:
             value: Current tag value
             timestamp: Timestamp of the read
         """
-        logger.debug(f"Evaluating threshold for tag_name='{tag_name}', value={value}, available config tags: {list(self.config.tags.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Evaluating threshold for tag_name='{tag_name}', value={value}, available config tags: {list(self.config.tags.keys())}")
 
-        if tag_name not in self.config.tags:
+        classified = self._classify_threshold(tag_name, value)
+        if classified is not None:
+            self._apply_threshold_results([(tag_name, value, timestamp) + classified])
+
+    def _classify_threshold(self, tag_name: str, value: Any) -> Optional[Tuple[bool, str]]:
+        """Check a tag value against its failure condition without touching shared state.
+
+        Args:
+            tag_name: Name of the tag (config key)
+            value: Current tag value
+
+        Returns:
+            Tuple of (violation, reason), or None if the tag is not configured
+        """
+        evaluator = self._evaluators.get(tag_name)
+        if evaluator is None:
             logger.warning(f"Tag '{tag_name}' not found in config.tags. Available tags: {list(self.config.tags.keys())}")
+            return None
+        return evaluator(value)
+
+    def _apply_threshold_results(self, threshold_results: List[Tuple[str, Any, datetime, bool, str]],
+                                 now: Optional[datetime] = None) -> None:
+        """Update violation tracking for classified tag values and emit the resulting events.
+
+        All active-violation bookkeeping happens under one lock acquisition;
+        events and auto-remediation run after the lock is released.
+
+        Args:
+            threshold_results: List of (tag_name, value, timestamp, violation, reason)
+            now: Timestamp for the emitted events (defaults to the current time)
+        """
+        if not threshold_results:
             return
 
-        tag_config = self.config.tags[tag_name]
-        violation = False
-        violation_reason = ""
-
-        logger.debug(f"Tag config for '{tag_name}': failure_condition={tag_config.failure_condition}, nominal={tag_config.nominal}, thresholds=({tag_config.failure_threshold_low}, {tag_config.failure_threshold_high})")
-
-        # Evaluate based on failure condition
-        if tag_config.failure_condition == 'equals':
-            if value == tag_config.failure_value:
-                violation = True
-                violation_reason = f"Value equals failure value: {tag_config.failure_value}"
-
-        elif tag_config.failure_condition == 'not_equals':
-            if value != tag_config.nominal:
-                violation = True
-                violation_reason = f"Value {value} does not equal nominal {tag_config.nominal}"
-
-        elif tag_config.failure_condition == 'outside_range':
-            if (tag_config.failure_threshold_low is not None and
-                value < tag_config.failure_threshold_low):
-                violation = True
-                violation_reason = f"Value {value} below threshold {tag_config.failure_threshold_low}"
-            elif (tag_config.failure_threshold_high is not None and
-                  value > tag_config.failure_threshold_high):
-                violation = True
-                violation_reason = f"Value {value} above threshold {tag_config.failure_threshold_high}"
-
-        elif tag_config.failure_condition == 'below':
-            if tag_config.failure_threshold_low is not None and value < tag_config.failure_threshold_low:
-                violation = True
-                violation_reason = f"Value {value} below threshold {tag_config.failure_threshold_low}"
-
-        elif tag_config.failure_condition == 'above':
-            if tag_config.failure_threshold_high is not None and value > tag_config.failure_threshold_high:
-                violation = True
-                violation_reason = f"Value {value} above threshold {tag_config.failure_threshold_high}"
-
-        # Handle violation (acquire lock only when modifying shared state)
-        if violation:
-            logger.debug(f"Violation detected for '{tag_name}': {violation_reason}")
-
-            # Check if this is a new violation or existing one
-            is_new_violation = False
-            with self._lock:
-                active_violation_keys = list(self._active_violations.keys())
-                logger.debug(f"Active violations before check: {active_violation_keys}")
-
-                if tag_name not in self._active_violations:
-                    # New violation
-                    is_new_violation = True
-                    self._total_violations += 1
-                    violation_obj = ThresholdViolation(
-                        tag_name=tag_name,
-                        expected_value=tag_config.nominal,
-                        actual_value=value,
-                        failure_condition=tag_config.failure_condition,
-                        timestamp=timestamp
-                    )
-                    self._active_violations[tag_name] = violation_obj
-                    # Reset normal reading count when violation is detected
-                    if tag_name in self._normal_readings_count:
+        violations = []  # (tag_name, value, reason, is_new_violation)
+        resolved = []
+        new_violation_count = 0
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        with self._violations_lock:
+            for tag_name, value, timestamp, violation, violation_reason in threshold_results:
+                if violation:
+                    if debug:
+                        logger.debug(f"Violation detected for '{tag_name}': {violation_reason}")
+                    is_new_violation = tag_name not in self._active_violations
+                    if is_new_violation:
+                        new_violation_count += 1
+                        tag_config = self.config.tags[tag_name]
+                        violation_obj = ThresholdViolation(
+                            tag_name=tag_name,
+                            expected_value=tag_config.nominal,
+                            actual_value=value,
+                            failure_condition=tag_config.failure_condition,
+                            timestamp=timestamp
+                        )
+                        self._active_violations[tag_name] = violation_obj
+                        # Reset normal reading count when violation is detected
+                        self._normal_readings_count.pop(tag_name, None)
+                        logger.info(f"New violation added to _active_violations for '{tag_name}'. Total active violations: {len(self._active_violations)}")
+                    else:
+                        # Existing violation - reset normal reading count since we're still violating
+                        if tag_name in self._normal_readings_count:
+                            self._normal_readings_count[tag_name] = 0
+                        if debug:
+                            logger.debug(f"Violation already exists in _active_violations for '{tag_name}'")
+                    violations.append((tag_name, value, violation_reason, is_new_violation))
+
+                elif tag_name in self._active_violations:
+                    # No violation detected - require multiple consecutive normal
+                    # readings before resolving (stability period)
+                    count = self._normal_readings_count.get(tag_name, 0) + 1
+                    self._normal_readings_count[tag_name] = count
+
+                    if debug:
+                        logger.debug(f"Tag '{tag_name}' has {count} consecutive normal readings (need {self._violation_resolution_stability_polls} to resolve)")
+
+                    if count >= self._violation_resolution_stability_polls:
+                        violation_obj = self._active_violations.pop(tag_name)
+                        violation_obj.resolved = True
+                        violation_obj.resolved_at = timestamp
+                        self._resolved_history.append(violation_obj)
                         del self._normal_readings_count[tag_name]
-                    logger.info(f"New violation added to _active_violations for '{tag_name}'. Total active violations: {len(self._active_violations)}")
+                        resolved.append(tag_name)
                 else:
-                    # Existing violation - reset normal reading count since we're still violating
-                    if tag_name in self._normal_readings_count:
-                        self._normal_readings_count[tag_name] = 0
-                    logger.debug(f"Violation already exists in _active_violations for '{tag_name}'")
+                    # No active violation, reset normal reading count
+                    self._normal_readings_count.pop(tag_name, None)
+
+        # Single-writer counter; updated outside the lock
+        self._total_violations += new_violation_count
 
-            # Emit violation event (outside lock)
+        # Emit events and trigger remediation outside the lock
+        for tag_name, value, violation_reason, is_new_violation in violations:
+            tag_config = self.config.tags[tag_name]
             self._emit_event(EventType.THRESHOLD_VIOLATION, {
                 'tag_name': tag_name,
                 'expected_value': tag_config.nominal,
                 'actual_value': value,
                 'failure_condition': tag_config.failure_condition,
                 'reason': violation_reason
-            }, Severity.WARNING, tag_name)
+            }, Severity.WARNING, tag_name, timestamp=now)
 
             logger.warning(f"Threshold violation detected for {tag_name}: {violation_reason}")
 
@@ -422,69 +638,108 @@ class MonitorService:
             if is_new_violation:
                 logger.info(f"New violation detected for {tag_name}: {violation_reason}")
 
-            # INFO level logging for auto-remediation conditions
-            logger.info(f"Auto-remediation check for {tag_name}:")
-            logger.info(f"  - is_new_violation: {is_new_violation}")
-            logger.info(f"  - auto_remediate config: {self.config.remediation.auto_remediate}")
-            logger.info(f"  - remediation_hook set: {self._remediation_hook is not None}")
+            self._check_auto_remediation(tag_name, is_new_violation)
 
-            # Trigger auto-remediation if enabled and this is a new violation
-            if is_new_violation and self.config.remediation.auto_remediate and self._remediation_hook:
-                try:
-                    # Default to 'reset' action for auto-remediation
-                    # Could be made configurable per tag in the future
-                    logger.info(f"Auto-remediation enabled: triggering reset for violation on {tag_name}")
-                    self._remediation_hook('reset', tag_name)
-                    logger.info(f"Auto-remediation hook called successfully for {tag_name}")
-                except Exception as e:
-                    logger.error(f"Error triggering auto-remediation: {e}", exc_info=True)
-            elif is_new_violation:
-                # Log why auto-remediation didn't trigger (only for new violations) at INFO level
-                reasons = []
-                if not self.config.remediation.auto_remediate:
-                    reasons.append("auto_remediate is False")
-                if not self._remediation_hook:
-                    reasons.append("remediation hook not set")
-                if reasons:
-                    logger.info(f"Auto-remediation not triggered for {tag_name}: {', '.join(reasons)}")
-                else:
-                    logger.info(f"Auto-remediation not triggered for {tag_name}: unknown reason")
-        else:
-            # No violation detected - check if we need to resolve an existing one
-            # Require multiple consecutive normal readings before resolving (stability period)
-            with self._lock:
-                if tag_name in self._active_violations:
-                    # Increment normal reading count
-                    if tag_name not in self._normal_readings_count:
-                        self._normal_readings_count[tag_name] = 0
-                    self._normal_readings_count[tag_name] += 1
-
-                    logger.debug(f"Tag '{tag_name}' has {self._normal_readings_count[tag_name]} consecutive normal readings (need {self._violation_resolution_stability_polls} to resolve)")
-
-                    # Only resolve if we have enough consecutive normal readings
-                    if self._normal_readings_count[tag_name] >= self._violation_resolution_stability_polls:
-                        violation_obj = self._active_violations[tag_name]
-                        violation_obj.resolved = True
-                        violation_obj.resolved_at = timestamp
+        for tag_name in resolved:
+            self._emit_event(EventType.THRESHOLD_VIOLATION, {
+                'tag_name': tag_name,
+                'resolved': True,
+                'message': f'Threshold violation resolved for {tag_name}'
+            }, Severity.INFO, tag_name, timestamp=now)
 
-                        # Remove from tracking
-                        del self._normal_readings_count[tag_name]
+            logger.info(f"Threshold violation resolved for {tag_name} after {self._violation_resolution_stability_polls} consecutive normal readings")
 
-                        # Emit resolution event (outside lock)
-                        self._emit_event(EventType.THRESHOLD_VIOLATION, {
-                            'tag_name': tag_name,
-                            'resolved': True,
-                            'message': f'Threshold violation resolved for {tag_name}'
-                        }, Severity.INFO, tag_name)
+    def _check_auto_remediation(self, tag_name: str, is_new_violation: bool) -> None:
+        """Trigger auto-remediation for a violation if enabled.
 
-                        logger.info(f"Threshold violation resolved for {tag_name} after {self._violation_resolution_stability_polls} consecutive normal readings")
-                else:
-                    # No active violation, reset normal reading count
-                    if tag_name in self._normal_readings_count:
-                        del self._normal_readings_count[tag_name]
+        Args:
+            tag_name: Name of the violating tag
+            is_new_violation: Whether the violation was just detected
+        """
+        # Diagnostics for auto-remediation conditions. This runs for every
+        # violating tag on every poll, so it is logged at INFO only when the
+        # decision inputs change and at DEBUG otherwise.
+        decision = (self.config.remediation.auto_remediate, self._remediation_hook is not None)
+        decision_changed = self._remediation_decisions.get(tag_name) != decision
+        if decision_changed:
+            self._remediation_decisions[tag_name] = decision
+        level = logging.INFO if decision_changed else logging.DEBUG
+        if logger.isEnabledFor(level):
+            logger.log(
+                level,
+                f"Auto-remediation check for {tag_name}: "
+                f"is_new_violation={is_new_violation}, "
+                f"auto_remediate={decision[0]}, "
+                f"remediation_hook set={decision[1]}"
+            )
+
+        # Trigger auto-remediation if enabled and this is a new violation
+        if is_new_violation and self.config.remediation.auto_remediate and self._remediation_hook:
+            try:
+                # Default to 'reset' action for auto-remediation
+                # Could be made configurable per tag in the future
+                logger.info(f"Auto-remediation enabled: triggering reset for violation on {tag_name}")
+                self._remediation_hook('reset', tag_name)
+                logger.info(f"Auto-remediation hook called successfully for {tag_name}")
+            except Exception as e:
+                logger.error(f"Error triggering auto-remediation: {e}", exc_info=True)
+        elif is_new_violation:
+            # Log why auto-remediation didn't trigger (only for new violations) at INFO level
+            reasons = []
+            if not self.config.remediation.auto_remediate:
+                reasons.append("auto_remediate is False")
+            if not self._remediation_hook:
+                reasons.append("remediation hook not set")
+            if reasons:
+                logger.info(f"Auto-remediation not triggered for {tag_name}: {', '.join(reasons)}")
+            else:
+                logger.info(f"Auto-remediation not triggered for {tag_name}: unknown reason")
+
+    @staticmethod
+    def _build_evaluator(tag_config: TagConfig) -> Callable[[Any], Tuple[bool, str]]:
+        """Build a threshold evaluator specialized for one tag.
+
+        The human-readable reason is only formatted when the value actually
+        violates the tag's failure condition.
+
+        Args:
+            tag_config: Tag configuration
+
+        Returns:
+            Function that takes a value and returns (violation, reason)
+        """
+        predicate = tag_config.predicate
+        condition = tag_config.failure_condition
+
+        if condition == 'equals':
+            reason = f"Value equals failure value: {tag_config.failure_value}"
+            return lambda value: (True, reason) if predicate(value) else (False, "")
+
+        if condition == 'not_equals':
+            nominal = tag_config.nominal
+            return lambda value: (
+                (True, f"Value {value} does not equal nominal {nominal}")
+                if predicate(value) else (False, "")
+            )
+
+        low = tag_config.failure_threshold_low
+        high = tag_config.failure_threshold_high
+
+        def evaluate(value: Any) -> Tuple[bool, str]:
+            if not predicate(value):
+                return False, ""
+            if low is not None and value < low:
+                return True, f"Value {value} below threshold {low}"
+            if high is not None and value > high:
+                return True, f"Value {value} above threshold {high}"
+            return True, ""
+
+        return evaluate
 
     def _emit_event(self, event_type: EventType, data: Dict[str, Any],
-                   severity: Severity, tag_name: Optional[str] = None) -> None:
+                   severity: Severity, tag_name: Optional[str] = None,
+                   suppress_socket: bool = False,
+                   timestamp: Optional[datetime] = None) -> None:
         """Emit an event via Socket.IO and store it.
 
         Args:
@@ -492,48 +747,105 @@ class MonitorService:
             data: Event data payload
             severity: Event severity
             tag_name: Optional tag name associated with event
+            suppress_socket: Store the event without emitting it (the caller
+                emits it as part of a batch)
+            timestamp: Event timestamp (defaults to the current time)
         """
-        event = Event(
-            event_type=event_type,
-            timestamp=datetime.now(),
-            data=data,
-            severity=severity,
-            tag_name=tag_name
-        )
-
-        # Store event
-        with self._lock:
-            self._events.append(event)
+        self._dispatch_events([(event_type, data, severity, tag_name,
+                                timestamp or datetime.now(), suppress_socket)])
 
-        # Emit via Socket.IO if available
-        if self.socketio:
+    def _dispatch_events(self, items: List[tuple]) -> None:
+        """Hand events to the emitter, or process them inline when it isn't running.
+
+        Args:
+            items: List of (event_type, data, severity, tag_name, timestamp, suppress_socket)
+        """
+        emit_q = self._emit_q
+        if emit_q is None:
+            self._process_emits(items)
+            return
+
+        for item in items:
             try:
+                emit_q.put_nowait(item)
+            except queue.Full:
+                # Drop the oldest queued event to make room
+                try:
+                    emit_q.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    emit_q.put_nowait(item)
+                except queue.Full:
+                    logger.warning(f"Event queue full, dropping {item[0].value} event")
+
+    def _process_emits(self, items: List[tuple]) -> None:
+        """Store a batch of events and emit them via Socket.IO.
+
+        All TAG_READ events in the batch go out as one 'tags_update' message;
+        other events are emitted on their own channels.
+
+        Args:
+            items: List of (event_type, data, severity, tag_name, timestamp, suppress_socket)
+        """
+        if not items:
+            return
+
+        events = [
+            Event(event_type=event_type, timestamp=timestamp, data=data,
+                  severity=severity, tag_name=tag_name)
+            for event_type, data, severity, tag_name, timestamp, _ in items
+        ]
+
+        # Store events
+        with self._events_lock:
+            for event in events:
+                self._events.append(event)
+                self._events_by_type[event.event_type].append(event)
+
+        # Emit via Socket.IO if available
+        if not self.socketio:
+            return
+
+        tag_reads = []
+        for event, item in zip(events, items):
+            if item[5]:  # suppress_socket
+                continue
+            event_type = event.event_type
+            if event_type == EventType.TAG_READ:
                 # Frontend expects the data payload directly for tag_read events
+                tag_reads.append(event.data)
+                continue
+            try:
                 # For connection events, frontend just needs the data dict (it calls addEvent which handles it)
                 # For other events, emit the full event structure
-                if event_type == EventType.TAG_READ:
-                    emit_data = data
-                elif event_type in (EventType.CONNECTION_RESTORED, EventType.CONNECTION_LOST):
-                    # Connection events: frontend expects just the data dict
-                    emit_data = data
+                if event_type in (EventType.CONNECTION_RESTORED, EventType.CONNECTION_LOST):
+                    emit_data = event.data
                 else:
-                    # For other events, emit the full event structure
                     emit_data = event.to_dict()
 
-                logger.debug(f"Emitting Socket.IO event: {event_type.value} with data: {emit_data}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Emitting Socket.IO event: {event_type.value} with data: {emit_data}")
                 self.socketio.emit(event_type.value, emit_data)
             except Exception as e:
                 logger.warning(f"Error emitting Socket.IO event: {e}")
 
+        # Tag reads are only worth serializing if a client is listening; they
+        # are still stored above for the REST API
+        if tag_reads and self._has_ws_clients():
+            try:
+                self.socketio.emit('tags_update', {'reads': tag_reads})
+            except Exception as e:
+                logger.warning(f"Error emitting Socket.IO event: {e}")
+
     def get_current_values(self) -> Dict[str, TagResult]:
         """Get current tag values.
 
         Returns:
-            Dictionary of tag names to TagResult
+            Dictionary of tag names to TagResult. This is a read-only snapshot
+            shared with other callers and must not be modified.
         """
-        with self._lock:
-            # Make a shallow copy (TagResult objects are immutable)
-            return dict(self._current_values)
+        return self._current_values
 
     def get_tag_history(self, tag_name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get historical values for a tag.
@@ -545,14 +857,17 @@ class MonitorService:
         Returns:
             List of historical data points
         """
-        with self._lock:
-            if tag_name not in self._tag_history:
+        with self._history_lock:
+            if tag_name not in self._ts_history:
                 return []
 
-            history = list(self._tag_history[tag_name])
-            if limit:
-                history = history[-limit:]
-            return history
+            timestamps = list(self._ts_history[tag_name])
+            values = list(self._val_history[tag_name])
+
+        if limit:
+            timestamps = timestamps[-limit:]
+            values = values[-limit:]
+        return [{'timestamp': t, 'value': v} for t, v in zip(timestamps, values)]
 
     def get_events(self, event_type: Optional[EventType] = None, limit: int = 100) -> List[Event]:
         """Get recent events.
@@ -564,11 +879,12 @@ class MonitorService:
         Returns:
             List of events
         """
-        with self._lock:
-            events = list(self._events)
-            if event_type:
-                events = [e for e in events if e.event_type == event_type]
-            return events[-limit:]
+        with self._events_lock:
+            events = self._events_by_type[event_type] if event_type else self._events
+            if limit > 0:
+                # Copy only the newest `limit` events, not the whole buffer
+                return list(islice(reversed(events), limit))[::-1]
+            return list(events)[-limit:]
 
     def get_active_violations(self) -> List[ThresholdViolation]:
         """Get active threshold violations.
@@ -576,8 +892,17 @@ class MonitorService:
         Returns:
             List of active violations
         """
-        with self._lock:
-            return [v for v in self._active_violations.values() if not v.resolved]
+        with self._violations_lock:
+            return list(self._active_violations.values())
+
+    def get_resolved_violations(self) -> List[ThresholdViolation]:
+        """Get recently resolved threshold violations.
+
+        Returns:
+            List of resolved violations, oldest first
+        """
+        with self._violations_lock:
+            return list(self._resolved_history)
 
     def clear_violation(self, tag_name: str) -> None:
         """Clear a violation for a specific tag.
@@ -590,7 +915,7 @@ class MonitorService:
         """
         logger.debug(f"clear_violation called for tag_name='{tag_name}'. Active violations before clear: {list(self._active_violations.keys())}")
 
-        with self._lock:
+        with self._violations_lock:
             if tag_name in self._active_violations:
                 del self._active_violations[tag_name]
                 # Reset normal reading count
@@ -602,8 +927,8 @@ class MonitorService:
 
         # After clearing, immediately re-check if the current value is still violating
         # This ensures that if remediation didn't fix the issue, the violation is re-detected
-        if tag_name in self._current_values:
-            current_result = self._current_values[tag_name]
+        current_result = self._current_values.get(tag_name)
+        if current_result is not None:
             if current_result.success:
                 logger.debug(f"Re-checking violation status for '{tag_name}' after clearing (current value: {current_result.value})")
                 # Re-evaluate threshold to see if violation still exists
@@ -615,24 +940,22 @@ class MonitorService:
         Returns:
             Dictionary with statistics
         """
-        with self._lock:
-            uptime = (datetime.now() - self._start_time).total_seconds()
-            connection_stats = self.plc_client.get_connection_stats()
-
-            # Calculate connection uptime percent
-            if connection_stats.connection_start_time:
-                connection_uptime = (
-                    datetime.now() - connection_stats.connection_start_time
-                ).total_seconds()
-                connection_uptime_percent = min(100.0, (connection_uptime / uptime) * 100) if uptime > 0 else 0.0
-            else:
-                connection_uptime_percent = 0.0
-
-            return {
-                'uptime_seconds': uptime,
-                'total_tag_reads': self._total_reads,
-                'total_violations': self._total_violations,
-                'active_violations': len(self.get_active_violations()),
-                'connection_uptime_percent': connection_uptime_percent,
-                'connection_stats': connection_stats.to_dict()
-            }
+        uptime = time.monotonic() - self._start_monotonic
+        connection_stats = self.plc_client.get_connection_stats()
+
+        # Calculate connection uptime percent
+        if connection_stats.connection_start_time:
+            connection_uptime = time.time() - connection_stats.connection_start_time.timestamp()
+            connection_uptime_percent = min(100.0, (connection_uptime / uptime) * 100) if uptime > 0 else 0.0
+        else:
+            connection_uptime_percent = 0.0
+
+        # Counters are read without locking; values may be a poll behind
+        return {
+            'uptime_seconds': uptime,
+            'total_tag_reads': self._total_reads,
+            'total_violations': self._total_violations,
+            'active_violations': len(self.get_active_violations()),
+            'connection_uptime_percent': connection_uptime_percent,
+            'connection_stats': connection_stats.to_dict()
+        }
@@ -1,9 +1,11 @@
 """PLC communication client using pycomm3 for Allen-Bradley CIP protocol."""
 import logging
+import re
 import threading
 import time
+from dataclasses import replace
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pycomm3 import LogixDriver
 from pycomm3.exceptions import CommError, RequestError, BufferEmptyError
 from pycomm3.cip.data_types import DataTypes
@@ -13,9 +15,50 @@ from app.config import PLCConfig, TagConfig
 
 logger = logging.getLogger(__name__)
 
+# Errors a mock PLC raises for CIP services it doesn't implement (0x08 = Service
+# Not Supported), or for tags pycomm3 doesn't know because tag list upload failed
+_MOCK_TOLERABLE_RE = re.compile(
+    r"service not supported|multiple service|0x08|buffemptyerror|"
+    r"failed to (?:parse reply|get attribute list|parse tag request)|tag doesn't exist",
+    re.IGNORECASE
+)
+# pycomm3 may close the connection after an unsupported service during connect
+_CONNECTION_CLOSED_RE = re.compile(r"connection.*closed|closed.*connection", re.IGNORECASE | re.DOTALL)
+
+# Config tag types -> pycomm3 data type names
+_TYPE_MAPPING: Dict[str, str] = {
+    'bool': 'BOOL',
+    'int': 'DINT',
+    'float': 'REAL',
+    'real': 'REAL',
+    'dint': 'DINT',
+}
+
+# One pycomm3 _tags entry template per data type, used to populate tags in mock
+# mode; each tag gets a copy with its tag_name filled in
+_TAG_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    type_name: {
+        'instance_id': 0,  # Mock PLC doesn't use instance IDs
+        'tag_type': 'atomic',  # Assume atomic tags for simplicity
+        'data_type': type_name,  # Required: same as data_type_name for atomic
+        'data_type_name': type_name,
+        'external_access': 'Read/Write',
+        'dim': 0,  # Scalar tags (not arrays)
+        'dimensions': [0, 0, 0],  # Required: list of 3 ints
+        'alias': False,
+        'type_class': DataTypes.get(type_name)  # Required: Python type class for encoding/decoding
+    }
+    for type_name in ('BOOL', 'DINT', 'REAL')
+}
+
 
 class PLCClient:
-    """Client for communicating with Allen-Bradley PLCs via CIP protocol."""
+    """Client for communicating with Allen-Bradley PLCs via CIP protocol.
+
+    The API is synchronous. run.py monkey-patches sockets with eventlet before
+    pycomm3 is imported, so driver I/O yields to other greenlets (web and
+    Socket.IO handlers) while waiting on the PLC instead of blocking them.
+    """
 
     def __init__(self, config: PLCConfig, tags_config: Optional[Dict[str, TagConfig]] = None):
         """Initialize PLC client.
@@ -28,12 +71,19 @@ class PLCClient:
         self._tags_config = tags_config or {}
         self._driver: Optional[LogixDriver] = None
         self._lock = threading.Lock()
-        self._read_lock = threading.Lock()  # Lock for serializing read operations
+        # Serializes reads on the single driver. The monitor poll loop is the only
+        # reader and read_tags batches into one request, so a driver pool would
+        # add CIP sessions (scarce on Micro800 and the mock PLC) without any
+        # concurrent callers to serve; stats/getters only take the brief _lock.
+        self._read_lock = threading.Lock()
         self._stats = ConnectionStats(
             connected=False,
             connection_start_time=None
         )
         self._last_error: Optional[str] = None
+        # Tag name -> (time.monotonic() of read, successful TagResult)
+        self._cache: Dict[str, Tuple[float, TagResult]] = {}
+        self._cache_ttl = config.read_cache_ms / 1000.0
 
     def connect(self) -> bool:
         """Establish connection to PLC.
@@ -64,21 +114,18 @@ class PLCClient:
                 init_program_tags=init_program_tags
             )
 
-            # Set micro800 override if mock_mode is enabled (independent of protocol_mode)
-            if self.config.mock_mode:
+            # Micro800 mode disables MSP and uses serial methods. It is set if mock_mode
+            # is enabled or protocol_mode is "serial" (the two are independent)
+            serial_mode = self.config.protocol_mode == "serial"
+            if self.config.mock_mode or serial_mode:
                 if hasattr(driver, '_micro800'):
                     driver._micro800 = True
                 if hasattr(driver, '_cfg'):
                     driver._cfg['micro800'] = True
-                logger.info("Set Micro800 override (mock_mode enabled)")
 
-            # Determine protocol mode behavior
-            if self.config.protocol_mode == "serial":
-                # Force Micro800 mode to disable MSP and use serial methods
-                if hasattr(driver, '_micro800'):
-                    driver._micro800 = True
-                if hasattr(driver, '_cfg'):
-                    driver._cfg['micro800'] = True
+            if self.config.mock_mode:
+                logger.info("Set Micro800 override (mock_mode enabled)")
+            if serial_mode:
                 logger.info("Forcing Micro800 mode (protocol_mode=serial, using serial methods)")
             else:
                 # protocol_mode == "default" - use pycomm3 default logic
@@ -96,36 +143,29 @@ class PLCClient:
                     if self.config.mock_mode:
                         self._populate_tags_from_config()
 
-                    self._stats.connected = True
-                    self._stats.connection_start_time = datetime.now()
-                    self._stats.last_successful_read = datetime.now()
+                    now = datetime.now()
+                    self._stats = replace(
+                        self._stats,
+                        connected=True,
+                        connection_start_time=now,
+                        last_successful_read=now
+                    )
                     logger.info(f"Successfully connected to PLC at {self.config.ip_address} (protocol_mode={self.config.protocol_mode}, mock_mode={self.config.mock_mode})")
                     return True
                 else:
                     logger.error("Failed to connect to PLC: driver reports not connected")
                     self._driver = None
-                    self._stats.connected = False
+                    self._stats = replace(self._stats, connected=False)
                     return False
 
         except (CommError, RequestError, Exception) as e:
                 error_msg = str(e)
-                error_lower = error_msg.lower()
-                error_type = type(e).__name__
+                is_mock, _ = self._classify_error(e, "connecting")
 
                 # In mock mode, handle Multiple Service Packet errors gracefully
                 # These errors occur when the mock PLC doesn't support certain CIP services
                 # but the connection can still be used for basic tag operations
-                if self.config.mock_mode and (
-                    "service not supported" in error_lower or
-                    "multiple service" in error_lower or
-                    "0x08" in error_msg or  # CIP error code 0x08 = Service Not Supported
-                    ("connection" in error_lower and "closed" in error_lower) or
-                    "buffemptyerror" in error_lower or  # BufferEmptyError from pycomm3
-                    error_type == "BufferEmptyError" or
-                    "failed to get attribute list" in error_lower or
-                    "failed to parse reply" in error_lower or
-                    "tag doesn't exist" in error_lower
-                ):
+                if is_mock or (self.config.mock_mode and _CONNECTION_CLOSED_RE.search(error_msg)):
                     # Check if we can still use the connection despite the error
                     # Sometimes pycomm3 closes the connection on these errors, but we can reconnect
                     logger.warning(
@@ -142,9 +182,13 @@ class PLCClient:
                                     # Connection is still open, use it
                                     # Manually populate _tags if tag list upload failed
                                     self._populate_tags_from_config()
-                                    self._stats.connected = True
-                                    self._stats.connection_start_time = datetime.now()
-                                    self._stats.last_successful_read = datetime.now()
+                                    now = datetime.now()
+                                    self._stats = replace(
+                                        self._stats,
+                                        connected=True,
+                                        connection_start_time=now,
+                                        last_successful_read=now
+                                    )
                                     logger.info("Connection usable despite error - continuing in mock mode")
                                     return True
                         except Exception:
@@ -155,7 +199,7 @@ class PLCClient:
                         logger.info("Connection closed due to unsupported service, but mock mode allows retries")
                         if self._driver is not None:
                             self._driver = None
-                        self._stats.connected = False
+                        self._stats = replace(self._stats, connected=False)
                         self._last_error = f"Mock PLC limitation: {error_msg[:200]}"
                         return False
 
@@ -165,9 +209,12 @@ class PLCClient:
                 with self._lock:
                     if self._driver is not None:
                         self._driver = None
-                    self._stats.connected = False
-                    self._stats.total_errors += 1
-                    self._stats.last_error = error_msg
+                    self._stats = replace(
+                        self._stats,
+                        connected=False,
+                        total_errors=self._stats.total_errors + 1,
+                        last_error=error_msg
+                    )
                 return False
 
     def disconnect(self) -> None:
@@ -178,7 +225,8 @@ class PLCClient:
                 return
             driver = self._driver
             self._driver = None  # Clear reference immediately to prevent new operations
-            self._stats.connected = False
+            self._stats = replace(self._stats, connected=False)
+            self._cache.clear()
 
         # Close connection outside lock to avoid blocking
         try:
@@ -194,13 +242,14 @@ class PLCClient:
         Returns:
             True if connected, False otherwise
         """
-        with self._lock:
-            if self._driver is None:
-                return False
-            try:
-                return self._driver.connected
-            except Exception:
-                return False
+        # Lock-free: _driver is only ever swapped as a whole reference
+        driver = self._driver
+        if driver is None:
+            return False
+        try:
+            return driver.connected
+        except Exception:
+            return False
 
     def check_connection_health(self) -> bool:
         """Check if the PLC connection is still alive without blocking.
@@ -210,15 +259,15 @@ class PLCClient:
         Returns:
             True if connection appears healthy, False otherwise
         """
-        with self._lock:
-            if self._driver is None:
-                return False
-            # Check if driver reports connected status
-            try:
-                return self._driver.connected
-            except Exception as e:
-                logger.debug(f"Connection health check failed: {e}")
-                return False
+        driver = self._driver
+        if driver is None:
+            return False
+        # Check if driver reports connected status
+        try:
+            return driver.connected
+        except Exception as e:
+            logger.debug(f"Connection health check failed: {e}")
+            return False
 
     def _populate_tags_from_config(self) -> None:
         """Manually populate pycomm3's _tags dictionary from config.
@@ -234,16 +283,6 @@ class PLCClient:
             return
 
         try:
-            # Map config types to pycomm3 data type names and type classes
-            # Use DataTypes.get() to get the type class for each data type
-            type_mapping = {
-                'bool': ('BOOL', DataTypes.get('BOOL')),
-                'int': ('DINT', DataTypes.get('DINT')),
-                'float': ('REAL', DataTypes.get('REAL')),
-                'real': ('REAL', DataTypes.get('REAL')),
-                'dint': ('DINT', DataTypes.get('DINT')),
-            }
-
             # Disable instance IDs to use tag names directly
             if hasattr(self._driver, '_cfg'):
                 self._driver._cfg['use_instance_ids'] = False
@@ -252,9 +291,9 @@ class PLCClient:
             if not hasattr(self._driver, '_tags') or self._driver._tags is None:
                 self._driver._tags = {}
 
-            # Populate _tags from config
+            # Resolve (tag name, config type) pairs, handling both TagConfig objects and dicts
+            resolved = []
             for config_key, tag_config in self._tags_config.items():
-                # Handle both TagConfig objects and dicts
                 if hasattr(tag_config, 'name'):
                     tag_name = tag_config.name
                     tag_type = tag_config.type if hasattr(tag_config, 'type') else 'DINT'
@@ -264,44 +303,41 @@ class PLCClient:
                 else:
                     tag_name = config_key
                     tag_type = 'DINT'
+                resolved.append((tag_name, tag_type))
 
-                pycomm3_type_name, type_class = type_mapping.get(tag_type.lower(), ('DINT', DataTypes.get('DINT')))
-
-                self._driver._tags[tag_name] = {
-                    'tag_name': tag_name,
-                    'instance_id': 0,  # Mock PLC doesn't use instance IDs
-                    'tag_type': 'atomic',  # Assume atomic tags for simplicity
-                    'data_type': pycomm3_type_name,  # Required: same as data_type_name for atomic
-                    'data_type_name': pycomm3_type_name,
-                    'external_access': 'Read/Write',
-                    'dim': 0,  # Scalar tags (not arrays)
-                    'dimensions': [0, 0, 0],  # Required: list of 3 ints
-                    'alias': False,
-                    'type_class': type_class  # Required: Python type class for encoding/decoding
-                }
+            # Populate _tags from config in one update
+            self._driver._tags.update({
+                tag_name: {**_TAG_TEMPLATES[_TYPE_MAPPING.get(tag_type.lower(), 'DINT')], 'tag_name': tag_name}
+                for tag_name, tag_type in resolved
+            })
 
             logger.info(f"Manually populated {len(self._driver._tags)} tags from config for mock mode")
         except Exception as e:
             logger.warning(f"Failed to populate tags from config: {e}")
 
-    def read_tag(self, tag_name: str) -> TagResult:
+    def read_tag(self, tag_name: str, timestamp: Optional[datetime] = None) -> TagResult:
         """Read a single tag from the PLC.
 
         Args:
             tag_name: Name of the tag to read
+            timestamp: Timestamp to record on the result (defaults to now)
 
         Returns:
             TagResult with value or error information
         """
-        timestamp = datetime.now()
+        if self._cache_ttl:
+            cached = self._cache.get(tag_name)
+            if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+                return cached[1]
 
-        # Ensure connection
-        if not self.is_connected():
-            if not self.connect():
-                error_msg = "Not connected to PLC and connection attempt failed"
-                with self._lock:
-                    self._stats.total_errors += 1
-                    self._stats.last_error = error_msg
+        if timestamp is None:
+            timestamp = datetime.now()
+
+        # Serialize read operations to prevent overwhelming the PLC
+        with self._read_lock:
+            driver, error_msg = self._connected_driver()
+            if driver is None:
+                self._record_error(error_msg)
                 return TagResult(
                     tag_name=tag_name,
                     value=None,
@@ -309,200 +345,384 @@ class PLCClient:
                     success=False,
                     error=error_msg
                 )
+            return self._read_tag_locked(driver, tag_name, timestamp)
+
+    def _connected_driver(self) -> Tuple[Optional[LogixDriver], Optional[str]]:
+        """Get the driver, reconnecting first if the connection is not healthy.
+
+        Must be called with _read_lock held.
+
+        Returns:
+            Tuple of (driver, None) on success or (None, error message) on failure
+        """
+        if not self.check_connection_health():
+            logger.warning("PLC connection not healthy before read, attempting reconnect")
+            if not self.connect():
+                return None, "Not connected to PLC and connection attempt failed"
 
-        # Get driver reference (brief lock to ensure it's not None)
         with self._lock:
-            if self._driver is None:
-                error_msg = "PLC driver not initialized"
-                self._stats.total_errors += 1
-                self._stats.last_error = error_msg
-                return TagResult(
-                    tag_name=tag_name,
-                    value=None,
-                    timestamp=timestamp,
-                    success=False,
-                    error=error_msg
-                )
-            # Get reference to driver (we'll use it outside the lock)
             driver = self._driver
+        if driver is None:
+            return None, "PLC driver not initialized"
+        return driver, None
 
-        # Serialize read operations to prevent overwhelming the PLC
-        # Acquire read lock to ensure only one read happens at a time
-        try:
-            with self._read_lock:
-                # Check connection health before attempting read
-                if not self.check_connection_health():
-                    logger.warning(f"Connection health check failed before reading tag '{tag_name}', attempting reconnect")
-                    # Connection appears dead, try to reconnect
-                    if not self.connect():
-                        error_msg = "Connection health check failed and reconnect attempt failed"
-                        with self._lock:
-                            self._stats.total_errors += 1
-                            self._stats.last_error = error_msg
-                        return TagResult(
-                            tag_name=tag_name,
-                            value=None,
-                            timestamp=timestamp,
-                            success=False,
-                            error=error_msg
-                        )
-                    # Re-check after reconnect
-                    with self._lock:
-                        driver = self._driver
-                    if driver is None:
-                        error_msg = "PLC driver not available after reconnect"
-                        with self._lock:
-                            self._stats.total_errors += 1
-                            self._stats.last_error = error_msg
-                        return TagResult(
-                            tag_name=tag_name,
-                            value=None,
-                            timestamp=timestamp,
-                            success=False,
-                            error=error_msg
-                        )
-
-                # Perform read with explicit timeout awareness
-                # The LogixDriver should use self.config.timeout, but we'll catch timeout-related errors
-                read_start_time = time.time()
-                try:
-                    result = driver.read(tag_name)
-                    read_duration = time.time() - read_start_time
-                    if read_duration > 0.5:  # Log if read takes more than 500ms
-                        logger.warning(f"PLC read for '{tag_name}' took {read_duration:.3f} seconds (slow, >500ms)")
-                    elif read_duration > 0.2:  # Log if read takes more than 200ms (moderate)
-                        logger.debug(f"PLC read for '{tag_name}' took {read_duration:.3f} seconds")
-                except Exception as read_error:
-                    read_duration = time.time() - read_start_time
-                    logger.error(f"PLC read for '{tag_name}' failed after {read_duration:.3f} seconds: {read_error}")
-                    raise
-
-                # Update statistics INSIDE the lock
-                with self._lock:
-                    if result.error:
-                        error_msg = f"Tag read error: {result.error}"
-                        logger.warning(f"Failed to read tag '{tag_name}': {error_msg}")
-                        self._stats.total_errors += 1
-                        self._stats.last_error = error_msg
-                        return TagResult(
-                            tag_name=tag_name,
-                            value=None,
-                            timestamp=timestamp,
-                            success=False,
-                            error=error_msg
-                        )
-
-                    # Success
-                    self._stats.total_reads += 1
-                    self._stats.last_successful_read = timestamp
-                    logger.debug(f"Read tag '{tag_name}': {result.value}")
-
-                    return TagResult(
-                        tag_name=tag_name,
-                        value=result.value,
-                        timestamp=timestamp,
-                        success=True,
-                        error=None
-                    )
+    def _record_error(self, error_msg: str) -> None:
+        """Count an error in the connection statistics.
+
+        Args:
+            error_msg: Error message to store as the last error
+        """
+        with self._lock:
+            self._stats = replace(
+                self._stats,
+                total_errors=self._stats.total_errors + 1,
+                last_error=error_msg
+            )
+
+    def _read_tag_locked(self, driver: LogixDriver, tag_name: str, timestamp: datetime) -> TagResult:
+        """Read a single tag with a driver already known to be connected.
+
+        Must be called with _read_lock held. Does no connection checks, so
+        read_tags can check the connection once for a whole batch.
+
+        Args:
+            driver: Connected LogixDriver
+            tag_name: Name of the tag to read
+            timestamp: Timestamp to record on the result
 
+        Returns:
+            TagResult with value or error information
+        """
+        # The LogixDriver should use self.config.timeout, but we'll catch timeout-related errors
+        # Successful read durations are only logged at WARNING/DEBUG, so skip
+        # timing when those are off; failures are logged either way
+        read_start_time = time.perf_counter() if logger.isEnabledFor(logging.WARNING) else None
+        try:
+            result = driver.read(tag_name)
         except (CommError, RequestError, BufferEmptyError) as e:
-            error_msg = str(e)
-            error_lower = error_msg.lower()
-            error_type = type(e).__name__
+            if read_start_time is not None:
+                read_duration = time.perf_counter() - read_start_time
+                logger.error(f"PLC read for '{tag_name}' failed after {read_duration:.3f} seconds: {e}")
+            else:
+                logger.error(f"PLC read for '{tag_name}' failed: {e}")
+            return TagResult(
+                tag_name=tag_name,
+                value=None,
+                timestamp=timestamp,
+                success=False,
+                error=self._record_comm_error(e, f"reading tag '{tag_name}'")
+            )
+        except Exception as e:
+            error_msg = f"Unexpected error reading tag '{tag_name}': {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            self._record_error(error_msg)
+            return TagResult(
+                tag_name=tag_name,
+                value=None,
+                timestamp=timestamp,
+                success=False,
+                error=error_msg
+            )
 
-            # Update statistics inside lock
-            with self._lock:
-                # In mock mode, handle service errors gracefully
-                # This includes "Tag doesn't exist" errors when tag list upload failed
-                if self.config.mock_mode and (
-                    "service not supported" in error_lower or
-                    "multiple service" in error_lower or
-                    "0x08" in error_msg or
-                    error_type == "BufferEmptyError" or
-                    "buffemptyerror" in error_lower or
-                    "failed to parse reply" in error_lower or
-                    "failed to get attribute list" in error_lower or
-                    "tag doesn't exist" in error_lower or
-                    "tag doesn't exist" in error_msg or
-                    "failed to parse tag request" in error_lower
-                ):
-                    # This is a known limitation of mock PLCs
-                    # When tag list upload fails, pycomm3 doesn't know about tags
-                    # but the tags still exist in the mock PLC
-                    logger.debug(
-                        f"Mock PLC service error for tag '{tag_name}' (handled gracefully): {error_msg[:200]}"
-                    )
-                    # Don't mark connection as lost for service errors in mock mode
-                    # The connection might still be usable for other operations
-                    self._stats.total_errors += 1
-                    self._stats.last_error = f"Mock PLC limitation: {error_msg[:200]}"
-                    return TagResult(
+        if read_start_time is not None:
+            read_duration = time.perf_counter() - read_start_time
+            if read_duration > 0.5:  # Log if read takes more than 500ms
+                logger.warning(f"PLC read for '{tag_name}' took {read_duration:.3f} seconds (slow, >500ms)")
+            elif read_duration > 0.2:  # Log if read takes more than 200ms (moderate)
+                logger.debug(f"PLC read for '{tag_name}' took {read_duration:.3f} seconds")
+
+        if result.error:
+            error_msg = f"Tag read error: {result.error}"
+            logger.warning(f"Failed to read tag '{tag_name}': {error_msg}")
+            self._record_error(error_msg)
+            return TagResult(
+                tag_name=tag_name,
+                value=None,
+                timestamp=timestamp,
+                success=False,
+                error=error_msg
+            )
+
+        with self._lock:
+            self._stats = replace(
+                self._stats,
+                total_reads=self._stats.total_reads + 1,
+                last_successful_read=timestamp
+            )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Read tag '{tag_name}': {result.value}")
+
+        tag_result = TagResult(
+            tag_name=tag_name,
+            value=result.value,
+            timestamp=timestamp,
+            success=True,
+            error=None
+        )
+        if self._cache_ttl:
+            self._cache[tag_name] = (time.monotonic(), tag_result)
+        return tag_result
+
+    def _classify_error(self, e: Exception, action: str) -> Tuple[bool, str]:
+        """Classify a pycomm3 communication exception.
+
+        Args:
+            e: Exception raised by the driver
+            action: What was being attempted, e.g. "reading tag 'Motor_Speed'"
+
+        Returns:
+            Tuple of (is_mock_tolerable, error message). Mock-tolerable errors are
+            known limitations of mock PLCs and are only reported in mock mode.
+        """
+        error_msg = str(e)
+        # This includes "Tag doesn't exist" errors when tag list upload failed:
+        # pycomm3 doesn't know about the tags, but they still exist in the mock PLC
+        if self.config.mock_mode and (
+            isinstance(e, BufferEmptyError) or _MOCK_TOLERABLE_RE.search(error_msg)
+        ):
+            return True, f"Mock PLC limitation: {error_msg[:200]}"
+        return False, f"PLC communication error {action}: {error_msg}"
+
+    def _record_comm_error(self, e: Exception, action: str) -> str:
+        """Classify a pycomm3 exception and record it in the statistics.
+
+        Args:
+            e: Exception raised by the driver
+            action: What was being attempted, e.g. "reading tag 'Motor_Speed'"
+
+        Returns:
+            Error message
+        """
+        is_mock, error_msg = self._classify_error(e, action)
+        if is_mock:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Mock PLC service error {action} (handled gracefully): {error_msg}")
+        else:
+            logger.error(error_msg)
+
+        with self._lock:
+            stats = self._stats
+            # Mock limitations leave the connection usable; anything else
+            # is treated as a lost connection
+            self._stats = replace(
+                stats,
+                connected=stats.connected and is_mock,
+                total_errors=stats.total_errors + 1,
+                last_error=error_msg
+            )
+        return error_msg
+
+    def read_tags(self, tag_names: List[str],
+                  timestamp: Optional[datetime] = None) -> Dict[str, TagResult]:
+        """Read multiple tags from the PLC.
+
+        Dictionary form of read_many(); see it for batching and caching.
+
+        Args:
+            tag_names: List of tag names to read
+            timestamp: Timestamp to record on the results (defaults to now)
+
+        Returns:
+            Dictionary mapping tag names to TagResult objects
+        """
+        return {result.tag_name: result for result in self.read_many(tag_names, timestamp)}
+
+    def read_many(self, tag_names: List[str],
+                  timestamp: Optional[datetime] = None) -> List[TagResult]:
+        """Read multiple tags from the PLC.
+
+        When protocol_mode is "default", all tags are read with one driver call
+        so pycomm3 can pack them into Multiple Service Packet (MSP) requests.
+        When protocol_mode is "serial" (e.g. Micro800, which doesn't support
+        MSP), tags are read one at a time. Either way the connection is checked
+        once and all results share one timestamp.
+
+        Tags read successfully within the last read_cache_ms are served from
+        the cache; only the stale ones are requested from the PLC.
+
+        Args:
+            tag_names: List of tag names to read
+            timestamp: Timestamp to record on the results (defaults to now)
+
+        Returns:
+            List of TagResult objects in the same order as tag_names
+        """
+        if not self._cache_ttl:
+            return self._read_many_uncached(tag_names, timestamp)
+
+        now = time.monotonic()
+        results: List[Optional[TagResult]] = []
+        stale = []
+        for tag_name in tag_names:
+            entry = self._cache.get(tag_name)
+            if entry is not None and now - entry[0] < self._cache_ttl:
+                results.append(entry[1])
+            else:
+                results.append(None)
+                stale.append(tag_name)
+        if not stale:
+            return results
+
+        fresh = iter(self._read_many_uncached(stale, timestamp))
+        return [result if result is not None else next(fresh) for result in results]
+
+    def _read_many_uncached(self, tag_names: List[str],
+                            timestamp: Optional[datetime] = None) -> List[TagResult]:
+        """Read multiple tags from the PLC, bypassing the read cache.
+
+        Args:
+            tag_names: List of tag names to read
+            timestamp: Timestamp to record on the results (defaults to now)
+
+        Returns:
+            List of TagResult objects in the same order as tag_names
+        """
+        if timestamp is None:
+            timestamp = datetime.now()
+
+        with self._read_lock:
+            driver, error_msg = self._connected_driver()
+            if driver is None:
+                self._record_error(error_msg)
+                return [
+                    TagResult(
                         tag_name=tag_name,
                         value=None,
                         timestamp=timestamp,
                         success=False,
-                        error=f"Mock PLC service not supported: {error_msg[:200]}"
+                        error=error_msg
                     )
+                    for tag_name in tag_names
+                ]
 
-                # For real errors or non-mock-mode, treat as connection failure
-                error_msg = f"PLC communication error reading tag '{tag_name}': {error_msg}"
-                logger.error(error_msg)
-                self._stats.connected = False  # Assume connection lost
-                self._stats.total_errors += 1
-                self._stats.last_error = error_msg
-                return TagResult(
+            if self.config.protocol_mode == "serial" or len(tag_names) < 2:
+                return self._read_many_serial(driver, tag_names, timestamp)
+            return self._read_many_batch(driver, tag_names, timestamp)
+
+    def _read_many_batch(self, driver: LogixDriver, tag_names: List[str],
+                         timestamp: datetime) -> List[TagResult]:
+        """Read multiple tags with a single driver.read() call.
+
+        Must be called with _read_lock held.
+
+        Args:
+            driver: Connected LogixDriver
+            tag_names: List of tag names to read
+            timestamp: Timestamp to record on the results
+
+        Returns:
+            List of TagResult objects in the same order as tag_names
+        """
+        def failed(error_msg: str) -> List[TagResult]:
+            return [
+                TagResult(
                     tag_name=tag_name,
                     value=None,
                     timestamp=timestamp,
                     success=False,
                     error=error_msg
                 )
+                for tag_name in tag_names
+            ]
+
+        # Read durations are only logged at WARNING/DEBUG
+        read_start_time = time.perf_counter() if logger.isEnabledFor(logging.WARNING) else None
+        try:
+            tags = driver.read(*tag_names)
+        except (CommError, RequestError, BufferEmptyError) as e:
+            return failed(self._record_comm_error(e, f"reading tags {tag_names}"))
         except Exception as e:
-            error_msg = f"Unexpected error reading tag '{tag_name}': {str(e)}"
+            error_msg = f"Unexpected error reading tags {tag_names}: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            with self._lock:
-                self._stats.total_errors += 1
-                self._stats.last_error = error_msg
-            return TagResult(
-                tag_name=tag_name,
-                value=None,
-                timestamp=timestamp,
-                success=False,
-                error=error_msg
+            self._record_error(error_msg)
+            return failed(error_msg)
+
+        if read_start_time is not None:
+            read_duration = time.perf_counter() - read_start_time
+            if read_duration > 0.5:  # Log if read takes more than 500ms
+                logger.warning(f"PLC batch read of {len(tag_names)} tags took {read_duration:.3f} seconds (slow, >500ms)")
+            elif read_duration > 0.2:  # Log if read takes more than 200ms (moderate)
+                logger.debug(f"PLC batch read of {len(tag_names)} tags took {read_duration:.3f} seconds")
+
+        read_time = time.monotonic()
+
+        # pycomm3 returns a list of Tag results in request order
+        if not isinstance(tags, list):
+            tags = [tags]
+
+        results = []
+        successful = 0
+        errors = 0
+        last_error = None
+        for tag_name, tag in zip(tag_names, tags):
+            if tag.error:
+                error_msg = f"Tag read error: {tag.error}"
+                logger.warning(f"Failed to read tag '{tag_name}': {error_msg}")
+                errors += 1
+                last_error = error_msg
+                results.append(TagResult(
+                    tag_name=tag_name,
+                    value=None,
+                    timestamp=timestamp,
+                    success=False,
+                    error=error_msg
+                ))
+            else:
+                successful += 1
+                tag_result = TagResult(
+                    tag_name=tag_name,
+                    value=tag.value,
+                    timestamp=timestamp,
+                    success=True,
+                    error=None
+                )
+                results.append(tag_result)
+                if self._cache_ttl:
+                    self._cache[tag_name] = (read_time, tag_result)
+
+        # Update statistics once for the batch
+        with self._lock:
+            stats = self._stats
+            self._stats = replace(
+                stats,
+                total_reads=stats.total_reads + successful,
+                total_errors=stats.total_errors + errors,
+                last_error=last_error or stats.last_error,
+                last_successful_read=timestamp if successful else stats.last_successful_read
             )
 
-    def read_tags(self, tag_names: List[str]) -> Dict[str, TagResult]:
-        """Read multiple tags from the PLC using individual single-tag reads.
+        return results
+
+    def _read_many_serial(self, driver: LogixDriver, tag_names: List[str],
+                          timestamp: datetime) -> List[TagResult]:
+        """Read multiple tags sequentially using individual single-tag reads.
 
-        This method reads tags sequentially. When protocol_mode is "serial",
-        this avoids Multiple Service Packets (MSP). When protocol_mode is "default",
-        pycomm3 may use MSP internally for other operations, but tag reads are
-        still performed sequentially.
+        Used when protocol_mode is "serial" to avoid Multiple Service Packets (MSP).
+        Must be called with _read_lock held.
 
         Args:
+            driver: Connected LogixDriver
             tag_names: List of tag names to read
+            timestamp: Timestamp to record on the results
 
         Returns:
-            Dictionary mapping tag names to TagResult objects
+            List of TagResult objects in the same order as tag_names
         """
-        results = {}
+        results = []
+        # Optional pause between reads for gateways that can't keep up
+        delay = self.config.inter_read_delay_ms / 1000.0
+        debug = logger.isEnabledFor(logging.DEBUG)
 
-        # Read tags sequentially to avoid overwhelming the PLC
-        # The read_lock in read_tag() ensures only one read happens at a time
-        # When protocol_mode is "serial", this avoids Multiple Service Packets (MSP)
         for i, tag_name in enumerate(tag_names):
-            logger.debug(f"Reading tag: {tag_name}")
-            result = self.read_tag(tag_name)
-            # Use the tag_name from the result (which should match the input)
-            results[result.tag_name] = result
-            logger.debug(f"Stored result for {result.tag_name}: success={result.success}, value={result.value if result.success else result.error}")
-
-            # Small delay between reads to prevent overwhelming the PLC
-            # Only delay if there are more tags to read
-            if i < len(tag_names) - 1:  # Don't delay after the last tag
-                time.sleep(0.05)  # 50ms delay between reads
-
-        logger.debug(f"read_tags returning {len(results)} results: {list(results.keys())}")
+            if delay and i:
+                time.sleep(delay)
+            result = self._read_tag_locked(driver, tag_name, timestamp)
+            results.append(result)
+            if debug:
+                logger.debug(f"Read result for {tag_name}: success={result.success}, value={result.value if result.success else result.error}")
+
+        if debug:
+            logger.debug(f"Serial read returning {len(results)} results: {tag_names}")
         return results
 
     def write_tag(self, tag_name: str, value: Any) -> bool:
@@ -515,104 +735,54 @@ class PLCClient:
         Returns:
             True if write successful, False otherwise
         """
+        # A write makes any cached read of this tag stale
+        self._cache.pop(tag_name, None)
+
         # Ensure connection
         if not self.is_connected():
             if not self.connect():
                 logger.error("Cannot write tag: not connected to PLC")
                 return False
 
-        # Get driver reference (brief lock to ensure it's not None)
-        with self._lock:
-            if self._driver is None:
-                error_msg = "PLC driver not initialized"
-                self._stats.total_errors += 1
-                self._stats.last_error = error_msg
-                return False
-            # Get reference to driver (we'll use it outside the lock)
-            driver = self._driver
+        # Get reference to driver (we'll use it outside the lock)
+        driver = self._driver
+        if driver is None:
+            self._record_error("PLC driver not initialized")
+            return False
 
         # Perform network I/O OUTSIDE the lock to avoid blocking API requests
         try:
             result = driver.write(tag_name, value)
-
-            # Update statistics INSIDE the lock
-            with self._lock:
-                if result.error:
-                    error_msg = f"Tag write error: {result.error}"
-                    logger.error(f"Failed to write tag '{tag_name}': {error_msg}")
-                    self._stats.total_errors += 1
-                    self._stats.last_error = error_msg
-                    return False
-
-                logger.info(f"Wrote tag '{tag_name}': {value}")
-                return True
-
         except (CommError, RequestError, BufferEmptyError) as e:
-            error_msg = str(e)
-            error_lower = error_msg.lower()
-            error_type = type(e).__name__
-
-            # Update statistics inside lock
-            with self._lock:
-                # In mock mode, handle service errors gracefully
-                # This includes "Tag doesn't exist" errors when tag list upload failed
-                if self.config.mock_mode and (
-                    "service not supported" in error_lower or
-                    "multiple service" in error_lower or
-                    "0x08" in error_msg or
-                    error_type == "BufferEmptyError" or
-                    "buffemptyerror" in error_lower or
-                    "failed to parse reply" in error_lower or
-                    "failed to get attribute list" in error_lower or
-                    "tag doesn't exist" in error_lower or
-                    "tag doesn't exist" in error_msg or
-                    "failed to parse tag request" in error_lower
-                ):
-                    logger.debug(
-                        f"Mock PLC service error writing tag '{tag_name}' (handled gracefully): {error_msg[:200]}"
-                    )
-                    # Don't mark connection as lost for service errors in mock mode
-                    self._stats.total_errors += 1
-                    self._stats.last_error = f"Mock PLC limitation: {error_msg[:200]}"
-                    return False
-
-                # For real errors or non-mock-mode, treat as connection failure
-                error_msg = f"PLC communication error writing tag '{tag_name}': {error_msg}"
-                logger.error(error_msg)
-                self._stats.connected = False
-                self._stats.total_errors += 1
-                self._stats.last_error = error_msg
-                return False
-
+            self._record_comm_error(e, f"writing tag '{tag_name}'")
+            return False
         except Exception as e:
             error_msg = f"Unexpected error writing tag '{tag_name}': {str(e)}"
             logger.error(error_msg, exc_info=True)
-            with self._lock:
-                self._stats.total_errors += 1
-                self._stats.last_error = error_msg
+            self._record_error(error_msg)
             return False
 
+        if result.error:
+            error_msg = f"Tag write error: {result.error}"
+            logger.error(f"Failed to write tag '{tag_name}': {error_msg}")
+            self._record_error(error_msg)
+            return False
+
+        logger.info(f"Wrote tag '{tag_name}': {value}")
+        return True
+
     def get_connection_stats(self) -> ConnectionStats:
         """Get connection statistics.
 
+        Statistics are replaced as a whole on every update, so this returns
+        the current snapshot without taking the lock. Callers must treat it
+        as read-only.
+
         Returns:
             ConnectionStats object with current statistics
         """
-        with self._lock:
-            # Check connection status directly (don't call is_connected() to avoid deadlock)
-            connected = False
-            if self._driver is not None:
-                try:
-                    connected = self._driver.connected
-                except Exception:
-                    connected = False
-            self._stats.connected = connected
-
-            return ConnectionStats(
-                connected=self._stats.connected,
-                last_successful_read=self._stats.last_successful_read,
-                total_reads=self._stats.total_reads,
-                total_errors=self._stats.total_errors,
-                connection_start_time=self._stats.connection_start_time,
-                last_error=self._stats.last_error
-            )
+        stats = self._stats
+        connected = self.is_connected()
+        if stats.connected != connected:
+            stats = replace(stats, connected=connected)
+        return stats
@@ -1,10 +1,38 @@
 """Web dashboard routes."""
-from flask import Blueprint, render_template
+import hashlib
+from typing import Optional, Tuple
+
+from flask import Blueprint, current_app, render_template, request
 
 web = Blueprint('web', __name__)
 
+# The dashboard template has no per-request variables, so it is rendered once
+# and served as (body, ETag) until the process restarts
+_dashboard_cache: Optional[Tuple[bytes, str]] = None
+
+
+def _render_dashboard() -> Tuple[bytes, str]:
+    """Render the dashboard, reusing the cached copy unless templates auto-reload.
+
+    Returns:
+        Tuple of (HTML bytes, ETag)
+    """
+    global _dashboard_cache
+    if _dashboard_cache is not None and not current_app.jinja_env.auto_reload:
+        return _dashboard_cache
+
+    body = render_template('dashboard.html').encode('utf-8')
+    _dashboard_cache = (body, hashlib.md5(body, usedforsecurity=False).hexdigest())
+    return _dashboard_cache
+
 
 @web.route('/')
 def dashboard():
     """Serve the main dashboard page."""
-    return render_template('dashboard.html')
+    body, etag = _render_dashboard()
+    response = current_app.response_class(body, mimetype='text/html')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 60
+    # Turns the response into a 304 when If-None-Match matches the ETag
+    return response.make_conditional(request)
@@ -1,11 +1,39 @@
 """CIP object definitions for mock PLC."""
+import sys
 import struct
+import itertools
 import logging
-from typing import Dict, Any, Optional
-from cpppo.server.enip import device
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Sequence, Union
 
 logger = logging.getLogger(__name__)
 
+# Precompiled little-endian codecs for CIP values
+_S_B = struct.Struct("<B")  # USINT
+_S_BB = struct.Struct("<BB")  # Revision (major, minor)
+_S_H = struct.Struct("<H")  # UINT
+_S_I = struct.Struct("<I")  # UDINT
+_S_BOOL = struct.Struct("<?")  # BOOL
+_S_INT = struct.Struct("<h")  # INT
+_S_DINT = struct.Struct("<i")  # DINT
+_S_REAL = struct.Struct("<f")  # REAL
+
+# Forward Open request header (CIP Vol 1, 3-5.5.2): Priority/Time_tick, Time-out
+# ticks, O->T and T->O Network Connection IDs, Connection Serial Number,
+# Originator Vendor ID, Originator Serial Number, Connection Timeout Multiplier,
+# 3 reserved bytes, O->T RPI, O->T parameters, T->O RPI, T->O parameters,
+# Transport Type/Trigger, Connection Path Size (words); the path follows
+_S_FORWARD_OPEN_REQUEST = struct.Struct("<BBIIHHIB3xIHIHBB")
+
+# Forward Open response: Extended Status, O->T Connection ID, T->O Connection ID,
+# Connection Serial Number
+_S_FORWARD_OPEN_RESPONSE = struct.Struct("<HIIH")
+
+# Immutable failure results, shared rather than rebuilt on each rejected request
+_FORWARD_OPEN_SHORT_REQUEST = (False, b"\x00", 0, 0)
+_FORWARD_OPEN_ERROR = (False, _S_H.pack(0x0100), 0, 0)  # Extended status 0x0100
+_READ_TAG_FAILED = (False, 0, b"")
+
 
 # CIP Object Class IDs
 CLASS_IDENTITY = 0x01
@@ -23,12 +51,42 @@ ATTR_SERIAL_NUMBER = 6
 ATTR_PRODUCT_NAME = 7
 ATTR_STATE = 8
 
+# Identity attribute ID -> encoder for that attribute of an IdentityObject
+_IDENTITY_ENCODERS = {
+    ATTR_VENDOR_ID: lambda obj: _S_H.pack(obj.vendor_id),
+    ATTR_DEVICE_TYPE: lambda obj: _S_H.pack(obj.device_type),
+    ATTR_PRODUCT_CODE: lambda obj: _S_H.pack(obj.product_code),
+    ATTR_REVISION: lambda obj: _S_BB.pack(obj.revision_major, obj.revision_minor),
+    ATTR_STATUS: lambda obj: _S_H.pack(obj.status),
+    ATTR_SERIAL_NUMBER: lambda obj: _S_I.pack(obj.serial_number),
+    ATTR_PRODUCT_NAME: lambda obj: obj.product_name,
+    ATTR_STATE: lambda obj: _S_B.pack(obj.state),
+}
+
+# Tag type -> (CIP type code, Python coercion, packer)
+_TAG_ENCODERS = {
+    "BOOL": (0xC1, bool, _S_BOOL.pack),
+    "INT": (0xC2, int, _S_INT.pack),
+    "DINT": (0xC4, int, _S_DINT.pack),
+    "REAL": (0xCA, float, _S_REAL.pack),
+}
+
+# CIP type code -> unpacker
+_TAG_DECODERS = {
+    0xC1: _S_BOOL.unpack_from,  # BOOL
+    0xC2: _S_INT.unpack_from,  # INT
+    0xC4: _S_DINT.unpack_from,  # DINT
+    0xCA: _S_REAL.unpack_from,  # REAL
+}
+
 
 class IdentityObject:
     """Device Identity Object (Class 0x01, Instance 0x01)."""
 
     def __init__(self):
         """Initialize identity object with Rockwell Automation values."""
+        # Packed attribute payloads, built on first use (see __setattr__)
+        self._packed: Optional[Dict[int, bytes]] = None
         # Rockwell Automation vendor ID
         self.vendor_id = 1
         self.device_type = 0x0C  # Programmable Logic Controller
@@ -40,6 +98,12 @@ class IdentityObject:
         self.product_name = b"Mock ControlLogix\x00"
         self.state = 0  # Non-existent
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field and drop the packed payloads so they are rebuilt."""
+        object.__setattr__(self, name, value)
+        if name != '_packed':
+            object.__setattr__(self, '_packed', None)
+
     def get_attribute(self, attribute_id: int) -> Optional[bytes]:
         """Get attribute value.
 
@@ -49,24 +113,23 @@ class IdentityObject:
         Returns:
             Attribute value as bytes or None if not found
         """
-        if attribute_id == ATTR_VENDOR_ID:
-            return struct.pack("<H", self.vendor_id)
-        elif attribute_id == ATTR_DEVICE_TYPE:
-            return struct.pack("<H", self.device_type)
-        elif attribute_id == ATTR_PRODUCT_CODE:
-            return struct.pack("<H", self.product_code)
-        elif attribute_id == ATTR_REVISION:
-            return struct.pack("<BB", self.revision_major, self.revision_minor)
-        elif attribute_id == ATTR_STATUS:
-            return struct.pack("<H", self.status)
-        elif attribute_id == ATTR_SERIAL_NUMBER:
-            return struct.pack("<I", self.serial_number)
-        elif attribute_id == ATTR_PRODUCT_NAME:
-            return self.product_name
-        elif attribute_id == ATTR_STATE:
-            return struct.pack("<B", self.state)
-        else:
-            return None
+        packed = self._packed
+        if packed is None:
+            packed = {attr: encoder(self) for attr, encoder in _IDENTITY_ENCODERS.items()}
+            self._packed = packed
+        return packed.get(attribute_id)
+
+
+@dataclass(slots=True)
+class Connection:
+    """An established CIP connection, keyed by its O->T connection ID."""
+    o_to_t: int
+    t_to_o: int
+    serial: int
+    originator_serial: int = 0
+    rpi_o_to_t: int = 0  # Requested packet interval, microseconds
+    rpi_t_to_o: int = 0
+    state: str = "established"
 
 
 class ConnectionManager:
@@ -74,9 +137,10 @@ class ConnectionManager:
 
     def __init__(self):
         """Initialize connection manager."""
-        self.connections: Dict[int, Dict[str, Any]] = {}
-        self.next_connection_id = 0x1000
-        self.next_connection_serial = 1
+        self.connections: Dict[int, Connection] = {}
+        # Each connection takes a pair of IDs (O->T, then T->O = O->T + 1)
+        self._connection_ids = itertools.count(0x1000, 2)
+        self._connection_serials = itertools.count(1)
 
     def forward_open(self, request_data: bytes) -> tuple:
         """Handle Forward Open service (0x54).
@@ -87,50 +151,71 @@ class ConnectionManager:
         Returns:
             Tuple of (success: bool, response_data: bytes, connection_id_o_to_t: int, connection_id_t_to_o: int)
         """
-        logger.debug(f"ConnectionManager.forward_open called - request data length: {len(request_data)}")
-        logger.debug(f"Request data (hex): {request_data.hex() if request_data else 'empty'}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"ConnectionManager.forward_open called - request data length: {len(request_data)}")
+            logger.debug(f"Request data (hex): {request_data.hex() if request_data else 'empty'}")
 
         try:
             # Parse Forward Open request
             # This is a simplified parser - full implementation would parse all fields
             if len(request_data) < 50:
-                logger.debug(f"Forward Open failed - insufficient data: {len(request_data)} bytes (need at least 50)")
-                return (False, b"\x00", 0, 0)  # Error response
-
-            # Extract connection IDs from request (simplified)
-            # In real implementation, parse priority, timeout, RPI, etc.
-            connection_id_o_to_t = self.next_connection_id
-            connection_id_t_to_o = self.next_connection_id + 1
-            self.next_connection_id += 2
-            logger.debug(f"Allocated connection IDs - O->T: 0x{connection_id_o_to_t:04X}, T->O: 0x{connection_id_t_to_o:04X}")
-
-            connection_serial = self.next_connection_serial
-            self.next_connection_serial += 1
-            logger.debug(f"Allocated connection serial: {connection_serial}")
+                if debug:
+                    logger.debug(f"Forward Open failed - insufficient data: {len(request_data)} bytes (need at least 50)")
+                return _FORWARD_OPEN_SHORT_REQUEST
+
+            # Parse the fixed header in one pass; network connection IDs are
+            # chosen by the target, so the requested ones are ignored
+            (_priority, _timeout_ticks, _req_o_to_t, _req_t_to_o, _req_serial,
+             vendor_id, originator_serial, _timeout_multiplier,
+             rpi_o_to_t, _params_o_to_t, rpi_t_to_o, _params_t_to_o,
+             _transport, _path_size) = _S_FORWARD_OPEN_REQUEST.unpack_from(request_data)
+            if debug:
+                logger.debug(f"Forward Open from vendor 0x{vendor_id:04X} serial 0x{originator_serial:08X} - RPI O->T: {rpi_o_to_t} us, T->O: {rpi_t_to_o} us")
+
+            connection_id_o_to_t = next(self._connection_ids)
+            connection_id_t_to_o = connection_id_o_to_t + 1
+            if debug:
+                logger.debug(f"Allocated connection IDs - O->T: 0x{connection_id_o_to_t:04X}, T->O: 0x{connection_id_t_to_o:04X}")
+
+            connection_serial = next(self._connection_serials)
+            if debug:
+                logger.debug(f"Allocated connection serial: {connection_serial}")
 
             # Store connection info
-            self.connections[connection_id_o_to_t] = {
-                "o_to_t": connection_id_o_to_t,
-                "t_to_o": connection_id_t_to_o,
-                "serial": connection_serial,
-                "state": "established"
-            }
-            logger.debug(f"Stored connection info - total connections: {len(self.connections)}")
+            self.connections[connection_id_o_to_t] = Connection(
+                connection_id_o_to_t,
+                connection_id_t_to_o,
+                connection_serial,
+                originator_serial,
+                rpi_o_to_t,
+                rpi_t_to_o
+            )
+            if debug:
+                logger.debug(f"Stored connection info - total connections: {len(self.connections)}")
 
             # Build Forward Open response
             # Response structure: Extended Status (2 bytes) + Connection IDs + Serial Number
-            response = struct.pack("<H", 0x0000)  # Success status
-            response += struct.pack("<I", connection_id_o_to_t)  # O->T Connection ID
-            response += struct.pack("<I", connection_id_t_to_o)  # T->O Connection ID
-            response += struct.pack("<H", connection_serial)  # Connection Serial Number
+            response = _S_FORWARD_OPEN_RESPONSE.pack(
+                0x0000,  # Success status
+                connection_id_o_to_t,
+                connection_id_t_to_o,
+                connection_serial
+            )
 
             logger.info(f"Forward Open successful: O->T={connection_id_o_to_t:04X}, T->O={connection_id_t_to_o:04X}, Serial={connection_serial}")
-            logger.debug(f"Forward Open response length: {len(response)} bytes")
+            if debug:
+                logger.debug(f"Forward Open response length: {len(response)} bytes")
             return (True, response, connection_id_o_to_t, connection_id_t_to_o)
 
+        except struct.error as e:
+            # Malformed request: expected from faulty clients, so the traceback
+            # is only formatted when debugging
+            logger.warning(f"Forward Open error: malformed request: {e}", exc_info=debug)
+            return _FORWARD_OPEN_ERROR
         except Exception as e:
             logger.error(f"Forward Open error: {e}", exc_info=True)
-            return (False, struct.pack("<H", 0x0100), 0, 0)  # Error status
+            return _FORWARD_OPEN_ERROR
 
     def forward_close(self, connection_id: int) -> bool:
         """Handle Forward Close service.
@@ -141,18 +226,22 @@ class ConnectionManager:
         Returns:
             True if successful
         """
-        logger.debug(f"ConnectionManager.forward_close called - connection ID: 0x{connection_id:04X}")
-        logger.debug(f"Current connections: {list(self.connections.keys())}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"ConnectionManager.forward_close called - connection ID: 0x{connection_id:04X}")
+            logger.debug(f"Current connections: {list(self.connections.keys())}")
+
+        # Single lookup: pop() both tests membership and removes the entry
+        connection_info = self.connections.pop(connection_id, None)
+        if connection_info is None:
+            if debug:
+                logger.debug(f"Forward Close failed - connection 0x{connection_id:04X} not found in active connections")
+            return False
 
-        if connection_id in self.connections:
-            connection_info = self.connections[connection_id]
-            del self.connections[connection_id]
-            logger.info(f"Forward Close: connection {connection_id:04X} closed (O->T: 0x{connection_info.get('o_to_t', 0):04X}, T->O: 0x{connection_info.get('t_to_o', 0):04X})")
+        logger.info(f"Forward Close: connection {connection_id:04X} closed (O->T: 0x{connection_info.o_to_t:04X}, T->O: 0x{connection_info.t_to_o:04X})")
+        if debug:
             logger.debug(f"Remaining connections: {len(self.connections)}")
-            return True
-        else:
-            logger.debug(f"Forward Close failed - connection 0x{connection_id:04X} not found in active connections")
-            return False
+        return True
 
 
 class TagObject:
@@ -166,85 +255,148 @@ class TagObject:
         """
         self.tag_manager = tag_manager
 
-    def read_tag(self, tag_path: bytes) -> tuple:
+    def read_tag(self, tag_path: Union[bytes, memoryview]) -> tuple:
         """Read tag value.
 
         Args:
-            tag_path: Tag path as bytes (CIP path format)
+            tag_path: Tag path as bytes or a memoryview into the request (CIP path format)
 
         Returns:
             Tuple of (success: bool, data_type: int, value: bytes)
         """
-        logger.debug(f"TagObject.read_tag called - path length: {len(tag_path)}")
-        logger.debug(f"Tag path (hex): {tag_path.hex() if tag_path else 'empty'}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"TagObject.read_tag called - path length: {len(tag_path)}")
+            logger.debug(f"Tag path (hex): {tag_path.hex() if tag_path else 'empty'}")
 
         try:
             # Parse tag path (simplified - assumes ASCII tag name)
             # Real implementation would parse full CIP path structure
-            tag_name = tag_path.decode('ascii', errors='ignore').strip('\x00')
-            logger.debug(f"Parsed tag name: '{tag_name}' (from {len(tag_path)} bytes)")
-
-            if not tag_name or tag_name not in self.tag_manager.tags:
-                logger.warning(f"Tag not found: '{tag_name}' (available tags: {list(self.tag_manager.tags.keys())})")
-                return (False, 0, b"")
-
-            # Get tag value
-            logger.debug(f"Retrieving value for tag '{tag_name}' from tag manager")
-            value = self.tag_manager.get_tag_value(tag_name)
-            tag_info = self.tag_manager.get_tag_info(tag_name)
-            tag_type = tag_info["type"]
-            logger.debug(f"Tag '{tag_name}' value: {value} (type: {tag_type}, Python type: {type(value).__name__})")
+            # str() decodes any buffer directly, so memoryviews aren't copied to bytes first;
+            # interning maps the name onto TagManager's key object for an identity-first lookup
+            tag_name = sys.intern(str(tag_path, 'ascii', 'ignore').strip('\x00'))
+            if debug:
+                logger.debug(f"Parsed tag name: '{tag_name}' (from {len(tag_path)} bytes)")
+
+            # Get tag type and value in one lookup
+            tag = self.tag_manager.get_tag(tag_name) if tag_name else None
+            if tag is None:
+                # Listing every tag is O(tags); only pay for it when the warning is emitted
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(f"Tag not found: '{tag_name}' (available tags: {list(self.tag_manager.tags)})")
+                return _READ_TAG_FAILED
+
+            tag_type, value = tag
+            if debug:
+                logger.debug(f"Tag '{tag_name}' value: {value} (type: {tag_type}, Python type: {type(value).__name__})")
 
             # Convert to CIP data type code and encode value
             cip_type_code, encoded_value = self._encode_value(tag_type, value)
-            logger.debug(f"Encoded tag '{tag_name}': CIP type=0x{cip_type_code:02X}, encoded length={len(encoded_value)} bytes")
-
-            logger.debug(f"Read tag {tag_name}: {value} (type: {tag_type}, CIP type: 0x{cip_type_code:02X}) - success")
+            if debug:
+                logger.debug(f"Encoded tag '{tag_name}': CIP type=0x{cip_type_code:02X}, encoded length={len(encoded_value)} bytes")
+                logger.debug(f"Read tag {tag_name}: {value} (type: {tag_type}, CIP type: 0x{cip_type_code:02X}) - success")
             return (True, cip_type_code, encoded_value)
 
+        except (struct.error, TypeError, ValueError) as e:
+            # Tag value doesn't fit its CIP type; not worth a traceback unless debugging
+            logger.warning(f"Read tag error: cannot encode value: {e}", exc_info=debug)
+            return _READ_TAG_FAILED
         except Exception as e:
             logger.error(f"Read tag error: {e}", exc_info=True)
-            return (False, 0, b"")
+            return _READ_TAG_FAILED
+
+    def read_tags(self, tag_paths: Sequence[Union[bytes, memoryview]]) -> List[tuple]:
+        """Read several tags with a single TagManager call.
 
-    def write_tag(self, tag_path: bytes, data_type: int, value_data: bytes) -> bool:
+        Args:
+            tag_paths: Tag paths as bytes or memoryviews (CIP path format)
+
+        Returns:
+            List of (success: bool, data_type: int, value: bytes) tuples in request order
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+        try:
+            # Same simplified parsing as read_tag
+            tag_names = [sys.intern(str(tag_path, 'ascii', 'ignore').strip('\x00'))
+                         for tag_path in tag_paths]
+            tags = self.tag_manager.get_many(tag_names)
+        except Exception as e:
+            logger.error(f"Read tags error: {e}", exc_info=True)
+            return [_READ_TAG_FAILED] * len(tag_paths)
+
+        results = []
+        for tag_name, tag in zip(tag_names, tags):
+            if tag is None:
+                logger.warning(f"Tag not found: '{tag_name}'")
+                results.append(_READ_TAG_FAILED)
+                continue
+            try:
+                cip_type_code, encoded_value = self._encode_value(*tag)
+            except (struct.error, TypeError, ValueError) as e:
+                logger.warning(f"Read tag error: cannot encode value of '{tag_name}': {e}", exc_info=debug)
+                results.append(_READ_TAG_FAILED)
+                continue
+            results.append((True, cip_type_code, encoded_value))
+
+        if debug:
+            logger.debug(f"Read {len(results)} tags in one batch: {tag_names}")
+        return results
+
+    def write_tag(self, tag_path: Union[bytes, memoryview], data_type: int,
+                  value_data: Union[bytes, memoryview]) -> bool:
         """Write tag value.
 
         Args:
-            tag_path: Tag path as bytes
+            tag_path: Tag path as bytes or a memoryview into the request
             data_type: CIP data type code
-            value_data: Value data as bytes
+            value_data: Value data as bytes or a memoryview into the request
 
         Returns:
             True if successful
         """
-        logger.debug(f"TagObject.write_tag called - path length: {len(tag_path)}, data_type: 0x{data_type:02X}, value_data length: {len(value_data)}")
-        logger.debug(f"Tag path (hex): {tag_path.hex() if tag_path else 'empty'}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"TagObject.write_tag called - path length: {len(tag_path)}, data_type: 0x{data_type:02X}, value_data length: {len(value_data)}")
+            logger.debug(f"Tag path (hex): {tag_path.hex() if tag_path else 'empty'}")
 
         try:
             # Parse tag path
-            tag_name = tag_path.decode('ascii', errors='ignore').strip('\x00')
-            logger.debug(f"Parsed tag name: '{tag_name}' (from {len(tag_path)} bytes)")
+            # str() decodes any buffer directly, so memoryviews aren't copied to bytes first;
+            # interning maps the name onto TagManager's key object for an identity-first lookup
+            tag_name = sys.intern(str(tag_path, 'ascii', 'ignore').strip('\x00'))
+            if debug:
+                logger.debug(f"Parsed tag name: '{tag_name}' (from {len(tag_path)} bytes)")
 
             if not tag_name or tag_name not in self.tag_manager.tags:
-                logger.warning(f"Tag not found for write: '{tag_name}' (available tags: {list(self.tag_manager.tags.keys())})")
+                # Listing every tag is O(tags); only pay for it when the warning is emitted
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(f"Tag not found for write: '{tag_name}' (available tags: {list(self.tag_manager.tags)})")
                 return False
 
             # Decode value
-            logger.debug(f"Decoding value for tag '{tag_name}' - CIP type: 0x{data_type:02X}, data length: {len(value_data)}")
+            if debug:
+                logger.debug(f"Decoding value for tag '{tag_name}' - CIP type: 0x{data_type:02X}, data length: {len(value_data)}")
             value = self._decode_value(data_type, value_data)
-            logger.debug(f"Decoded value for tag '{tag_name}': {value} (Python type: {type(value).__name__})")
+            if debug:
+                logger.debug(f"Decoded value for tag '{tag_name}': {value} (Python type: {type(value).__name__})")
 
             # Set tag value
-            logger.debug(f"Setting tag value for '{tag_name}' via tag manager")
+            if debug:
+                logger.debug(f"Setting tag value for '{tag_name}' via tag manager")
             success = self.tag_manager.set_tag_value(tag_name, value)
 
-            if success:
-                logger.debug(f"Write tag {tag_name}: {value} (type: {type(value).__name__}) - success")
-            else:
-                logger.debug(f"Write tag {tag_name} failed - tag manager returned False")
+            if debug:
+                if success:
+                    logger.debug(f"Write tag {tag_name}: {value} (type: {type(value).__name__}) - success")
+                else:
+                    logger.debug(f"Write tag {tag_name} failed - tag manager returned False")
 
             return success
 
+        except (struct.error, TypeError, ValueError) as e:
+            # Short or malformed value data from the client; not worth a traceback unless debugging
+            logger.warning(f"Write tag error: malformed value data: {e}", exc_info=debug)
+            return False
         except Exception as e:
             logger.error(f"Write tag error: {e}", exc_info=True)
             return False
@@ -259,19 +411,11 @@ class TagObject:
         Returns:
             Tuple of (cip_type_code: int, encoded_bytes: bytes)
         """
-        if tag_type == "BOOL":
-            return (0xC1, struct.pack("<?", bool(value)))
-        elif tag_type == "INT":
-            return (0xC2, struct.pack("<h", int(value)))
-        elif tag_type == "DINT":
-            return (0xC4, struct.pack("<i", int(value)))
-        elif tag_type == "REAL":
-            return (0xCA, struct.pack("<f", float(value)))
-        else:
-            # Default to DINT
-            return (0xC4, struct.pack("<i", int(value)))
+        # Unknown types default to DINT
+        cip_type_code, coerce, pack = _TAG_ENCODERS.get(tag_type, _TAG_ENCODERS["DINT"])
+        return (cip_type_code, pack(coerce(value)))
 
-    def _decode_value(self, cip_type_code: int, data: bytes) -> Any:
+    def _decode_value(self, cip_type_code: int, data: Union[bytes, memoryview]) -> Any:
         """Decode value from CIP format.
 
         Args:
@@ -281,14 +425,8 @@ class TagObject:
         Returns:
             Decoded value
         """
-        if cip_type_code == 0xC1:  # BOOL
-            return struct.unpack("<?", data[:1])[0]
-        elif cip_type_code == 0xC2:  # INT
-            return struct.unpack("<h", data[:2])[0]
-        elif cip_type_code == 0xC4:  # DINT
-            return struct.unpack("<i", data[:4])[0]
-        elif cip_type_code == 0xCA:  # REAL
-            return struct.unpack("<f", data[:4])[0]
-        else:
+        unpack = _TAG_DECODERS.get(cip_type_code)
+        if unpack is None:
             # Default to DINT
-            return struct.unpack("<i", data[:4])[0] if len(data) >= 4 else 0
+            return _S_DINT.unpack_from(data)[0] if len(data) >= 4 else 0
+        return unpack(data)[0]
@@ -2,6 +2,7 @@
 import argparse
 import logging
 import os
+import sched
 import threading
 import time
 from typing import Optional
@@ -24,40 +25,57 @@ except ImportError:
     from cip_objects import TagObject, ConnectionManager, IdentityObject
     from cip_services import CIPServiceHandler
 
-# Set logging level for all relevant modules
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
-# Also set DEBUG for cpppo-related modules
-logging.getLogger('cpppo').setLevel(logging.DEBUG)
-logging.getLogger('mock.cip_objects').setLevel(logging.DEBUG)
-logging.getLogger('mock.cip_services').setLevel(logging.DEBUG)
-logging.getLogger('mock.tag_manager').setLevel(logging.DEBUG)
-# Handle relative import paths
-logging.getLogger('cip_objects').setLevel(logging.DEBUG)
-logging.getLogger('cip_services').setLevel(logging.DEBUG)
-logging.getLogger('tag_manager').setLevel(logging.DEBUG)
+# Log level for the simulator and cpppo; logging is configured in main() rather
+# than at import so that importing CIPPLC doesn't turn on per-tag-access DEBUG output
+DEFAULT_LOG_LEVEL = os.environ.get("MOCK_PLC_LOG_LEVEL", "INFO")
 
+# Loggers that get the level explicitly, since cpppo resets the root level from -v.
+# Bare names cover running this file as a script (relative imports)
+_LOGGER_NAMES = (
+    __name__, 'cpppo',
+    'mock.cip_objects', 'mock.cip_services', 'mock.tag_manager',
+    'cip_objects', 'cip_services', 'tag_manager',
+)
 
-# Global tag manager (set by CIPPLC instance before starting server)
-_global_tag_manager = None
 
+def configure_logging(level: str = DEFAULT_LOG_LEVEL):
+    """Configure simulator logging.
 
-def set_global_tag_manager(tag_manager):
-    """Set global tag manager for ModeAwareAttribute instances."""
-    global _global_tag_manager
-    _global_tag_manager = tag_manager
+    Args:
+        level: Log level name (DEBUG, INFO, WARNING, ...), case-insensitive
+    """
+    level = level.upper()
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    for name in _LOGGER_NAMES:
+        logging.getLogger(name).setLevel(level)
 
 
 class ModeAwareAttribute(device.Attribute):
     """cpppo Attribute that applies operating mode transformations.
 
-    cpppo calls this with (name, parser) signature, so we use global tag_manager.
+    cpppo calls this with (name, parser) signature, so the tag manager can't be
+    passed in; use bind() to get a subclass with the tag manager set on the class.
     """
 
+    tag_manager: Optional[TagManager] = None
+
+    @classmethod
+    def bind(cls, tag_manager: TagManager) -> type:
+        """Create an attribute class bound to a tag manager.
+
+        Args:
+            tag_manager: TagManager instance to serve tag values from
+
+        Returns:
+            ModeAwareAttribute subclass to pass to cpppo as attribute_class
+        """
+        return type(cls.__name__, (cls,), {"tag_manager": tag_manager})
+
     def __init__(self, *args, **kwargs):
         """Initialize mode-aware attribute.
 
@@ -101,56 +119,56 @@ class ModeAwareAttribute(device.Attribute):
         Args:
             key: Index or slice. If slice, returns a list; if index, returns single value.
         """
-        global _global_tag_manager
+        tag_manager = self.tag_manager
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"ModeAwareAttribute.__getitem__ called for {self.tag_name} with key={key}")
 
-        logger.debug(f"ModeAwareAttribute.__getitem__ called for {self.tag_name} with key={key}")
-
-        if _global_tag_manager is None:
+        if tag_manager is None:
             logger.warning(f"Tag manager not set for {self.tag_name}")
-            default_value = 0 if not isinstance(key, slice) else [0]
-            logger.debug(f"Returning default value {default_value} for {self.tag_name} (no tag manager)")
+            default_value = [0] if type(key) is slice else 0
+            if debug:
+                logger.debug(f"Returning default value {default_value} for {self.tag_name} (no tag manager)")
             return default_value
 
         try:
-            logger.debug(f"Retrieving tag value for {self.tag_name} from tag manager")
-            value = _global_tag_manager.get_tag_value(self.tag_name)
-            logger.debug(f"Attribute read {self.tag_name}: {value} (type: {type(value).__name__})")
-
-            # If key is a slice, return a list (cpppo expects iterable for slices)
-            if isinstance(key, slice):
-                # Return a list with the value (for scalar tags, just one element)
-                result = [value]
-                logger.debug(f"Returning slice result for {self.tag_name}: {result}")
-                return result
-            else:
-                # Single index access, return the value directly
-                logger.debug(f"Returning single value for {self.tag_name}: {value}")
-                return value
-        except KeyError:
-            logger.warning(f"Tag {self.tag_name} not found in tag manager")
-            default_value = 0 if not isinstance(key, slice) else [0]
-            logger.debug(f"Returning default value {default_value} for {self.tag_name} (KeyError)")
-            return default_value
+            # get_tag returns None for unknown tags, so a miss doesn't raise
+            tag = tag_manager.get_tag(self.tag_name)
         except Exception as e:
             logger.error(f"Error reading tag {self.tag_name}: {e}", exc_info=True)
-            default_value = 0 if not isinstance(key, slice) else [0]
-            logger.debug(f"Returning default value {default_value} for {self.tag_name} (exception)")
-            return default_value
+            return [0] if type(key) is slice else 0
+
+        if tag is None:
+            logger.warning(f"Tag {self.tag_name} not found in tag manager")
+            return [0] if type(key) is slice else 0
+
+        value = tag[1]
+        if debug:
+            logger.debug(f"Attribute read {self.tag_name}: {value} (type: {type(value).__name__})")
+
+        # Tags are scalar: a slice gets a one-element list (cpppo expects an
+        # iterable), an index gets the value. slice can't be subclassed, so an
+        # exact type check is enough
+        return [value] if type(key) is slice else value
 
     def __setitem__(self, key, value):
         """Set tag value."""
-        global _global_tag_manager
-
-        logger.debug(f"ModeAwareAttribute.__setitem__ called for {self.tag_name} with key={key}, value={value} (type: {type(value).__name__})")
+        tag_manager = self.tag_manager
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"ModeAwareAttribute.__setitem__ called for {self.tag_name} with key={key}, value={value} (type: {type(value).__name__})")
 
-        if _global_tag_manager is None:
+        if tag_manager is None:
             logger.warning(f"Tag manager not set for {self.tag_name}")
             return
 
         try:
-            logger.debug(f"Setting tag value for {self.tag_name} via tag manager")
-            _global_tag_manager.set_tag_value(self.tag_name, value)
-            logger.debug(f"Attribute write {self.tag_name}: {value} (type: {type(value).__name__}) - success")
+            if type(key) is slice:
+                # cpppo writes slices with an iterable of values; tags are scalar
+                value = next(iter(value))
+            tag_manager.set_tag_value(self.tag_name, value)
+            if debug:
+                logger.debug(f"Attribute write {self.tag_name}: {value} (type: {type(value).__name__}) - success")
         except Exception as e:
             logger.error(f"Failed to set tag {self.tag_name}: {e}", exc_info=True)
 
@@ -158,6 +176,10 @@ class ModeAwareAttribute(device.Attribute):
 class CIPPLC:
     """Full CIP protocol-compatible PLC simulator."""
 
+    # Housekeeping intervals (seconds)
+    WATCHDOG_INTERVAL = 30
+    STATS_INTERVAL = 30
+
     def __init__(self, ip: str = "0.0.0.0", port: int = 44818,
                  mode: OperatingMode = OperatingMode.NORMAL):
         """Initialize CIP PLC simulator.
@@ -189,8 +211,8 @@ class CIPPLC:
         # cpppo server components
         self.server: Optional[device.Device] = None
         self.server_thread: Optional[threading.Thread] = None
-        self.watchdog_thread: Optional[threading.Thread] = None
-        self.stats_logger_thread: Optional[threading.Thread] = None
+        self.housekeeping_thread: Optional[threading.Thread] = None
+        self._housekeeping_stop: Optional[threading.Event] = None
 
     def start(self):
         """Start the CIP PLC server."""
@@ -207,19 +229,16 @@ class CIPPLC:
             )
             self.server_thread.start()
 
-            # Start watchdog thread to monitor server health
-            self.watchdog_thread = threading.Thread(
-                target=self._watchdog_thread,
-                daemon=True
-            )
-            self.watchdog_thread.start()
-
-            # Start statistics logger thread
-            self.stats_logger_thread = threading.Thread(
-                target=self._stats_logger_thread,
+            # Start one housekeeping thread for the watchdog and statistics
+            # ticks; each run gets its own stop event so a restart never
+            # shares state with a thread from a previous start()
+            self._housekeeping_stop = threading.Event()
+            self.housekeeping_thread = threading.Thread(
+                target=self._housekeeping_thread,
+                args=(self._housekeeping_stop,),
                 daemon=True
             )
-            self.stats_logger_thread.start()
+            self.housekeeping_thread.start()
 
             # Give server time to start
             time.sleep(1)
@@ -252,27 +271,12 @@ class CIPPLC:
             if not callable(enip_main):
                 raise TypeError(f"enip_main is not callable, it's a {type(enip_main)}")
 
-            # Set global tag manager BEFORE creating attributes
-            set_global_tag_manager(self.tag_manager)
+            # Attributes created by cpppo read and write this instance's tags
+            attribute_class = ModeAwareAttribute.bind(self.tag_manager)
 
-            # Build tag definitions for cpppo
+            # Tag definitions for cpppo
             # Format: name -> (CIP_type_string, count)
-            cpppo_tag_defs = {}
-            for tag_name in self.tag_manager.list_tags():
-                tag_info = self.tag_manager.get_tag_info(tag_name)
-                tag_type = tag_info["type"]
-
-                # Map to cpppo type strings
-                if tag_type == "BOOL":
-                    cpppo_type = "BOOL"
-                elif tag_type in ["INT", "DINT"]:
-                    cpppo_type = "DINT"
-                elif tag_type == "REAL":
-                    cpppo_type = "REAL"
-                else:
-                    cpppo_type = "DINT"
-
-                cpppo_tag_defs[tag_name] = (cpppo_type, 1)  # Scalar tags
+            cpppo_tag_defs = self.tag_manager.cpppo_tag_defs()
 
             # Build address string
             address = f"{self.ip}:{self.port}"
@@ -307,7 +311,7 @@ class CIPPLC:
                 try:
                     logger.debug("Calling enip_main - this is a blocking call")
                     enip_main(
-                        attribute_class=ModeAwareAttribute,
+                        attribute_class=attribute_class,
                         args=sys.argv[1:]  # Pass all args including tag definitions
                     )
                     logger.info("enip_main returned (server stopped normally)")
@@ -329,39 +333,48 @@ class CIPPLC:
     def stop(self):
         """Stop the CIP PLC server."""
         self.running = False
+        if self._housekeeping_stop:
+            self._housekeeping_stop.set()
         if self.server_thread:
             self.server_thread.join(timeout=5.0)
-        if self.watchdog_thread:
-            self.watchdog_thread.join(timeout=2.0)
-        if self.stats_logger_thread:
-            self.stats_logger_thread.join(timeout=2.0)
+        if self.housekeeping_thread:
+            self.housekeeping_thread.join(timeout=2.0)
         logger.info("CIP PLC stopped")
 
-    def _watchdog_thread(self):
-        """Watchdog thread to monitor server health."""
-        last_log = time.time()
-        while self.running:
-            time.sleep(5)  # Check every 5 seconds
-            if not self.running:
+    def _housekeeping_thread(self, stop_event: threading.Event):
+        """Run the periodic watchdog and statistics ticks until stopped.
+
+        Args:
+            stop_event: Set by stop() to end this thread
+        """
+        scheduler = sched.scheduler(time.monotonic, time.sleep)
+        scheduler.enter(self.WATCHDOG_INTERVAL, 1, self._watchdog_tick, (scheduler,))
+        scheduler.enter(self.STATS_INTERVAL, 1, self._stats_tick, (scheduler,))
+        # Run due ticks, then wait on the stop event rather than sleeping so
+        # stop() wakes this thread immediately
+        while not stop_event.is_set():
+            delay = scheduler.run(blocking=False)
+            if delay is None:
                 break
-            current_time = time.time()
-            # Log periodic health check every 30 seconds
-            elapsed = current_time - last_log
-            if elapsed >= 30:
-                logger.debug("CIP PLC watchdog: server process appears responsive")
-                last_log = current_time
-
-    def _stats_logger_thread(self):
+            stop_event.wait(delay)
+
+    def _watchdog_tick(self, scheduler: sched.scheduler):
+        """Periodic health check log."""
+        if not self.running:
+            return
+        logger.debug("CIP PLC watchdog: server process appears responsive")
+        scheduler.enter(self.WATCHDOG_INTERVAL, 1, self._watchdog_tick, (scheduler,))
+
+    def _stats_tick(self, scheduler: sched.scheduler):
         """Periodic statistics logging."""
-        while self.running:
-            time.sleep(30)  # Log stats every 30 seconds
-            if not self.running:
-                break
-            try:
-                stats = self.get_statistics()
-                logger.info(f"CIP PLC stats: {stats}")
-            except Exception as e:
-                logger.warning(f"Error getting CIP PLC statistics: {e}")
+        if not self.running:
+            return
+        try:
+            stats = self.get_statistics()
+            logger.info(f"CIP PLC stats: {stats}")
+        except Exception as e:
+            logger.warning(f"Error getting CIP PLC statistics: {e}")
+        scheduler.enter(self.STATS_INTERVAL, 1, self._stats_tick, (scheduler,))
 
     def set_mode(self, mode: OperatingMode):
         """Change operating mode.
@@ -401,9 +414,13 @@ def main():
     parser.add_argument("--port", type=int, default=44818, help="Port to listen on")
     parser.add_argument("--mode", choices=["normal", "degraded", "failed", "unresponsive"],
                      default="normal", help="Operating mode")
+    parser.add_argument("--log-level", default=DEFAULT_LOG_LEVEL,
+                     help="Log level (default: $MOCK_PLC_LOG_LEVEL or INFO)")
 
     args = parser.parse_args()
 
+    configure_logging(args.log_level)
+
     mode = OperatingMode(args.mode)
     cip_plc = CIPPLC(ip=args.ip, port=args.port, mode=mode)
 
@@ -30,13 +30,19 @@ class ModeAwareAttribute(device.Attribute):
     def __getitem__(self, key):
         """Get tag value with mode transformation."""
         try:
-            value = self.tag_manager.get_tag_value(self.tag_name)
-            logger.debug(f"Read {self.tag_name}: {value}")
-            return value
-        except (KeyError, Exception) as e:
+            tag = self.tag_manager.get_tag(self.tag_name)
+        except Exception as e:
             logger.warning(f"Error reading {self.tag_name}: {e}")
             return 0
 
+        if tag is None:
+            logger.warning(f"Error reading {self.tag_name}: tag not found")
+            return 0
+
+        value = tag[1]
+        logger.debug(f"Read {self.tag_name}: {value}")
+        return value
+
     def __setitem__(self, key, value):
         """Set tag value."""
         try:
@@ -65,24 +71,13 @@ def create_cip_plc(ip="127.0.0.1", port=44818, mode=OperatingMode.NORMAL):
     # Format: name -> Attribute instance
     from cpppo.server.enip import BOOL, DINT, REAL
 
-    tag_defs = {}
-    for tag_name in tag_manager.list_tags():
-        tag_info = tag_manager.get_tag_info(tag_name)
-        tag_type = tag_info["type"]
-
-        # Create appropriate parser
-        if tag_type == "BOOL":
-            parser = BOOL
-        elif tag_type in ["INT", "DINT"]:
-            parser = DINT
-        elif tag_type == "REAL":
-            parser = REAL
-        else:
-            parser = DINT
+    parsers = {"BOOL": BOOL, "DINT": DINT, "REAL": REAL}
 
+    tag_defs = {}
+    for tag_name, (cpppo_type, _count) in tag_manager.cpppo_tag_defs().items():
         # Create mode-aware attribute
         tag_defs[tag_name] = ModeAwareAttribute(
-            tag_manager, tag_name, parser
+            tag_manager, tag_name, parsers[cpppo_type]
         )
 
     return tag_manager, tag_defs
@@ -103,22 +98,8 @@ def main():
     # Create tag manager and definitions
     tag_manager, tag_defs = create_cip_plc(args.ip, args.port, mode)
 
-    # Build tag definitions in format cpppo expects: name -> (type_string, count)
-    cpppo_tag_defs = {}
-    for tag_name, attr in tag_defs.items():
-        tag_info = tag_manager.get_tag_info(tag_name)
-        tag_type = tag_info["type"]
-
-        if tag_type == "BOOL":
-            cpppo_type = "BOOL"
-        elif tag_type in ["INT", "DINT"]:
-            cpppo_type = "DINT"
-        elif tag_type == "REAL":
-            cpppo_type = "REAL"
-        else:
-            cpppo_type = "DINT"
-
-        cpppo_tag_defs[tag_name] = (cpppo_type, 1)
+    # Tag definitions in format cpppo expects: name -> (type_string, count)
+    cpppo_tag_defs = tag_manager.cpppo_tag_defs()
 
     # Build address
     address = f"{args.ip}:{args.port}"
@@ -1,6 +1,7 @@
 """CIP service handlers for mock PLC."""
 import struct
 import logging
+from itertools import groupby
 from typing import Tuple, Optional
 try:
     from mock.cip_objects import TagObject, ConnectionManager, IdentityObject
@@ -158,8 +159,20 @@ class CIPServiceHandler:
         logger.debug(f"Read Tag request - path length: {len(tag_path)}, request data length: {len(request_data)}")
         logger.debug(f"Tag path (hex): {tag_path.hex() if tag_path else 'empty'}")
 
-        success, data_type, value_bytes = self.tag_object.read_tag(tag_path)
+        return self._read_tag_response(*self.tag_object.read_tag(tag_path))
 
+    def _read_tag_response(self, success: bool, data_type: int,
+                           value_bytes: bytes) -> Tuple[bool, int, bytes]:
+        """Build the Read Tag service reply from a TagObject read result.
+
+        Args:
+            success: Whether the read succeeded
+            data_type: CIP data type code
+            value_bytes: Encoded value
+
+        Returns:
+            Tuple of (success, status_code, response_data)
+        """
         if success:
             # Response: Status (1 byte) + Data Type (1 byte) + Data
             response = struct.pack("<B", ERROR_SUCCESS)  # Status
@@ -189,7 +202,7 @@ class CIPServiceHandler:
             return (False, ERROR_NOT_ENOUGH_DATA, b"")
 
         data_type = request_data[0]
-        value_data = request_data[1:]
+        value_data = memoryview(request_data)[1:]  # Decoded in place, no copy
         logger.debug(f"Write Tag - data_type: 0x{data_type:02X}, value_data length: {len(value_data)}")
 
         success = self.tag_object.write_tag(tag_path, data_type, value_data)
@@ -307,7 +320,7 @@ class CIPServiceHandler:
 
         count = request_data[0]
         offset = 1
-        responses = []
+        services = []
 
         for i in range(count):
             if offset + 2 > len(request_data):
@@ -335,21 +348,35 @@ class CIPServiceHandler:
 
             # Remaining data is service-specific
             service_data = request_data[offset:offset+next_offset-3-path_length] if next_offset > 0 else b""
-
-            # Handle service
-            success, status, response_data = self.handle_service(
-                service_code, request_path, service_data
-            )
-
-            # Build response for this service
-            service_response = struct.pack("<B", status) + response_data
-            responses.append(service_response)
+            services.append((service_code, request_path, service_data))
 
             if next_offset > 0:
                 offset += next_offset - 3 - path_length
             else:
                 break
 
+        # Runs of consecutive tag reads are answered with one batched TagObject
+        # call; everything else goes through the regular dispatcher. Services
+        # are still answered in packet order, so a read after a write sees it.
+        results = []
+        for is_read, run in groupby(services, key=lambda service: service[0] == SERVICE_READ_TAG):
+            if is_read:
+                results.extend(
+                    self._read_tag_response(*result)
+                    for result in self.tag_object.read_tags([request_path for _, request_path, _ in run])
+                )
+            else:
+                results.extend(
+                    self.handle_service(service_code, request_path, service_data)
+                    for service_code, request_path, service_data in run
+                )
+
+        responses = []
+        for success, status, response_data in results:
+            # Build response for this service
+            service_response = struct.pack("<B", status) + response_data
+            responses.append(service_response)
+
         # Build multiple service response
         response = struct.pack("<B", count)  # Count
         for resp in responses:
@@ -1,9 +1,10 @@
 """Tag management with operating mode support for CIP PLC simulator."""
+import sys
 import time
 import random
 import logging
 from enum import Enum
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -56,6 +57,14 @@ class TagManager:
         "string": "STRING"
     }
 
+    # Tag type -> cpppo tag type; INT is served as DINT, unknown types default to DINT
+    CPPPO_TYPE_MAP = {
+        "BOOL": "BOOL",
+        "INT": "DINT",
+        "DINT": "DINT",
+        "REAL": "REAL"
+    }
+
     def __init__(self, mode: OperatingMode = OperatingMode.NORMAL):
         """Initialize tag manager.
 
@@ -65,9 +74,10 @@ class TagManager:
         self.mode = mode
         self.tags: Dict[str, Dict[str, Any]] = {}
 
-        # Initialize tags from defaults
+        # Initialize tags from defaults, keyed by interned names so decoded
+        # request names (also interned) resolve to the same str objects
         for tag_name, tag_data in self.DEFAULT_TAGS.items():
-            self.tags[tag_name] = tag_data.copy()
+            self.tags[sys.intern(tag_name)] = tag_data.copy()
 
         # Degradation state
         self.degradation_start = time.time()
@@ -77,6 +87,9 @@ class TagManager:
         self.read_count = 0
         self.write_count = 0
 
+        # cpppo tag definitions, built on first use and reset by add_tag
+        self._cpppo_tag_defs: Optional[Dict[str, Tuple[str, int]]] = None
+
     def set_mode(self, mode: OperatingMode):
         """Change operating mode.
 
@@ -104,8 +117,48 @@ class TagManager:
             raise KeyError(f"Tag {tag_name} not found")
 
         tag_data = self.tags[tag_name]
-        base_value = tag_data["value"]
+        return self._read_value(tag_data, tag_data.get("type", "DINT"))
+
+    def get_tag(self, tag_name: str) -> Optional[Tuple[str, Any]]:
+        """Get a tag's type and current value with a single lookup.
+
+        Args:
+            tag_name: Name of the tag
+
+        Returns:
+            Tuple of (type, value transformed by mode) or None if not found
+        """
+        tag_data = self.tags.get(tag_name)
+        if tag_data is None:
+            return None
+
         tag_type = tag_data.get("type", "DINT")
+        return (tag_type, self._read_value(tag_data, tag_type))
+
+    def get_many(self, tag_names: Iterable[str]) -> List[Optional[Tuple[str, Any]]]:
+        """Get type and current value for several tags in one call.
+
+        Args:
+            tag_names: Names of the tags
+
+        Returns:
+            List of (type, value) tuples in request order, None for unknown tags
+        """
+        tags = self.tags
+        read_value = self._read_value
+        results = []
+        for tag_name in tag_names:
+            tag_data = tags.get(tag_name)
+            if tag_data is None:
+                results.append(None)
+            else:
+                tag_type = tag_data.get("type", "DINT")
+                results.append((tag_type, read_value(tag_data, tag_type)))
+        return results
+
+    def _read_value(self, tag_data: Dict, tag_type: str) -> Any:
+        """Count a read and return the tag's value for the current mode."""
+        base_value = tag_data["value"]
         nominal = tag_data.get("nominal", base_value)
 
         self.read_count += 1
@@ -255,6 +308,20 @@ class TagManager:
         """
         return list(self.tags.keys())
 
+    def cpppo_tag_defs(self) -> Dict[str, Tuple[str, int]]:
+        """Get cpppo tag definitions for all tags.
+
+        Returns:
+            Dictionary of tag name -> (cpppo type string, element count)
+        """
+        if self._cpppo_tag_defs is None:
+            type_map = self.CPPPO_TYPE_MAP
+            self._cpppo_tag_defs = {
+                tag_name: (type_map.get(tag_data.get("type", "DINT"), "DINT"), 1)  # Scalar tags
+                for tag_name, tag_data in self.tags.items()
+            }
+        return self._cpppo_tag_defs
+
     def add_tag(self, tag_name: str, tag_type: str, initial_value: Any, **kwargs):
         """Add a new tag.
 
@@ -264,12 +331,13 @@ class TagManager:
             initial_value: Initial value
             **kwargs: Additional tag properties (nominal, variance, etc.)
         """
-        self.tags[tag_name] = {
+        self.tags[sys.intern(tag_name)] = {
             "type": tag_type,
             "value": initial_value,
             "nominal": kwargs.get("nominal", initial_value),
             **kwargs
         }
+        self._cpppo_tag_defs = None
         logger.info(f"Added tag {tag_name} of type {tag_type}")
 
     def get_statistics(self) -> Dict[str, Any]:
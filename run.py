@@ -16,6 +16,7 @@ from app.config import load_config, get_config
 from app.plc_client import PLCClient
 from app.aap_client import AAPClient
 from app.monitor import MonitorService
+from app.models import JSONCodec
 from app.chaos import ChaosEngine
 from app.api import api, init_api
 from app.web import web
@@ -103,7 +104,7 @@ def create_app():
     app.config['SECRET_KEY'] = os.getenv('FLASK_SECRET_KEY', 'plc-remedy-secret-key-change-in-production')
 
     # Initialize Socket.IO (assign to global)
-    socketio = SocketIO(app, cors_allowed_origins="*", async_mode='eventlet')
+    socketio = SocketIO(app, cors_allowed_origins="*", async_mode='eventlet', json=JSONCodec)
 
     try:
         # Load configuration
@@ -1,4 +1,5 @@
 """Unit tests for AAP client."""
+import dataclasses
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -45,7 +46,7 @@ def test_aap_client_launch_mock_job(aap_client):
 @patch('app.aap_client.requests.Session')
 def test_aap_client_launch_real_job(mock_session_class, aap_config):
     """Test launching a real AAP job."""
-    aap_config.mock_mode = False
+    aap_config = dataclasses.replace(aap_config, mock_mode=False)
     aap_client = AAPClient(aap_config)
 
     mock_session = MagicMock()
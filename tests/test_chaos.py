@@ -1,9 +1,10 @@
 """Unit tests for chaos engine."""
 import pytest
+from datetime import datetime, timedelta
 from unittest.mock import Mock
 
-from app.chaos import ChaosEngine, FailureType
-from app.config import ChaosConfig, AppConfig, PLCConfig, TagConfig, DashboardConfig, AAPConfig, RemediationConfig
+from app.chaos import ChaosEngine, FailureType, STARTUP_GRACE_PERIOD_SECONDS
+from app.config import ChaosConfig, AppConfig, PLCConfig, TagConfig, DashboardConfig, AAPConfig, RemediationConfig, LoggingConfig
 
 
 @pytest.fixture
@@ -12,14 +13,14 @@ def chaos_config():
     return ChaosConfig(
         enabled=True,
         failure_injection_rate=0.1,
-        failure_types=["value_anomaly", "network_timeout"],
+        failure_types=["value_anomaly", "network_timeout", "connection_loss"],
         network_timeout_ms=5000,
         anomaly_duration_seconds=10
     )
 
 
 @pytest.fixture
-def app_config():
+def app_config(chaos_config):
     """Create a test application configuration."""
     return AppConfig(
         plc=PLCConfig(ip_address="192.168.1.100"),
@@ -34,15 +35,19 @@ def app_config():
         },
         aap=AAPConfig(),
         remediation=RemediationConfig(),
-        chaos=ChaosConfig(),
-        dashboard=DashboardConfig()
+        chaos=chaos_config,
+        dashboard=DashboardConfig(),
+        logging=LoggingConfig()
     )
 
 
 @pytest.fixture
 def chaos_engine(chaos_config, app_config):
     """Create a test chaos engine."""
-    return ChaosEngine(chaos_config, app_config)
+    engine = ChaosEngine(chaos_config, app_config)
+    # Start past the startup grace period so injections take effect
+    engine._start_time = datetime.now() - timedelta(seconds=STARTUP_GRACE_PERIOD_SECONDS)
+    return engine
 
 
 def test_chaos_engine_init(chaos_engine, chaos_config):
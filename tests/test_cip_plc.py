@@ -1,4 +1,6 @@
 """Unit tests for CIP-compatible mock PLC."""
+import logging
+import struct
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -67,6 +69,16 @@ def test_tag_manager_set_tag_value(tag_manager):
     assert tag_manager.tags["Motor_Speed"]["value"] == 2000
 
 
+def test_tag_manager_get_tag(tag_manager):
+    """Test fused type/value lookup counts as a single read."""
+    tag_type, value = tag_manager.get_tag("Light_Status")
+
+    assert tag_type == "BOOL"
+    assert value is True
+    assert tag_manager.read_count == 1
+    assert tag_manager.get_tag("Nonexistent_Tag") is None
+
+
 def test_tag_object_read_tag(tag_object):
     """Test tag object read operation."""
     success, data_type, value_bytes = tag_object.read_tag(b"Light_Status")
@@ -75,6 +87,15 @@ def test_tag_object_read_tag(tag_object):
     assert len(value_bytes) > 0
 
 
+def test_tag_object_read_tags(tag_object):
+    """Test batched tag reads keep request order and flag unknown tags."""
+    results = tag_object.read_tags([b"Light_Status", b"Nonexistent_Tag", b"Motor_Direction"])
+
+    assert [success for success, _, _ in results] == [True, False, True]
+    assert results[2][1] == 0xC4  # DINT
+    assert tag_object.tag_manager.read_count == 2
+
+
 def test_tag_object_write_tag(tag_object):
     """Test tag object write operation."""
     # Write a DINT value
@@ -82,6 +103,14 @@ def test_tag_object_write_tag(tag_object):
     assert success is True
 
 
+def test_tag_object_write_tag_malformed(tag_object, caplog):
+    """Test that short value data is rejected as an expected, non-error failure."""
+    success = tag_object.write_tag(b"Motor_Speed", 0xCA, b"\x00")  # REAL needs 4 bytes
+
+    assert success is False
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
+
+
 def test_connection_manager_forward_open(connection_manager):
     """Test Forward Open operation."""
     # Simplified Forward Open request
@@ -94,6 +123,18 @@ def test_connection_manager_forward_open(connection_manager):
     assert len(response) > 0
 
 
+def test_connection_manager_forward_close(connection_manager):
+    """Test Forward Close removes the connection exactly once."""
+    _, _, conn_o_to_t, conn_t_to_o = connection_manager.forward_open(b"\x00" * 50)
+
+    connection = connection_manager.connections[conn_o_to_t]
+    assert connection.t_to_o == conn_t_to_o
+    assert not hasattr(connection, '__dict__')
+    assert connection_manager.forward_close(conn_o_to_t) is True
+    assert conn_o_to_t not in connection_manager.connections
+    assert connection_manager.forward_close(conn_o_to_t) is False
+
+
 def test_identity_object_get_attribute(identity_object):
     """Test identity object attribute retrieval."""
     # Test vendor ID attribute
@@ -102,6 +143,14 @@ def test_identity_object_get_attribute(identity_object):
     assert len(attr_value) == 2  # UINT16
 
 
+def test_identity_object_attribute_cache(identity_object):
+    """Test that packed attributes are reused and rebuilt when a field changes."""
+    assert identity_object.get_attribute(5) is identity_object.get_attribute(5)  # ATTR_STATUS
+
+    identity_object.status = 0x0030
+    assert identity_object.get_attribute(5) == b"\x30\x00"
+
+
 def test_service_handler_read_tag(service_handler):
     """Test service handler Read Tag."""
     success, status, response = service_handler.handle_service(
@@ -131,6 +180,18 @@ def test_tag_manager_list_tags(tag_manager):
     assert "Motor_Speed" in tags
 
 
+def test_tag_manager_cpppo_tag_defs(tag_manager):
+    """Test cpppo tag definitions are mapped once and refreshed on add_tag."""
+    defs = tag_manager.cpppo_tag_defs()
+    assert defs["Light_Status"] == ("BOOL", 1)
+    assert defs["Motor_Speed"] == ("DINT", 1)
+    assert tag_manager.cpppo_tag_defs() is defs
+    assert tag_manager.read_count == 0
+
+    tag_manager.add_tag("Line_Pressure", "INT", 40)
+    assert tag_manager.cpppo_tag_defs()["Line_Pressure"] == ("DINT", 1)
+
+
 def test_tag_manager_statistics(tag_manager):
     """Test getting statistics."""
     # Perform some operations
@@ -141,3 +202,92 @@ def test_tag_manager_statistics(tag_manager):
     assert stats["read_count"] > 0
     assert stats["write_count"] > 0
     assert stats["total_tags"] > 0
+
+
+def test_mode_aware_attribute_bind(tag_manager):
+    """Test that bound attribute classes serve values from their own tag manager."""
+    pytest.importorskip("cpppo")
+    from cpppo.server.enip import parser
+    from mock.cip_plc import ModeAwareAttribute
+
+    attribute_class = ModeAwareAttribute.bind(tag_manager)
+    attribute = attribute_class(name="Light_Status", type_cls=parser.BOOL)
+
+    assert ModeAwareAttribute.tag_manager is None
+    assert attribute[0:1] == [True]
+    attribute[0] = False
+    assert tag_manager.tags["Light_Status"]["value"] is False
+
+
+def test_mode_aware_attribute_slice_access(tag_manager):
+    """Test that scalar tags accept both index and slice reads and writes."""
+    pytest.importorskip("cpppo")
+    from cpppo.server.enip import parser
+    from mock.cip_plc import ModeAwareAttribute
+
+    attribute = ModeAwareAttribute.bind(tag_manager)(name="Motor_Direction", type_cls=parser.DINT)
+
+    attribute[0:1] = [2]
+    assert tag_manager.tags["Motor_Direction"]["value"] == 2
+    attribute[0] = 1
+    assert tag_manager.tags["Motor_Direction"]["value"] == 1
+    assert attribute[0] == attribute[0:1][0]
+
+
+def test_mode_aware_attribute_empty_slice_write(tag_manager, caplog):
+    """Test that an empty slice write is logged as a failed write instead of raising."""
+    pytest.importorskip("cpppo")
+    from cpppo.server.enip import parser
+    from mock.cip_plc import ModeAwareAttribute
+
+    attribute = ModeAwareAttribute.bind(tag_manager)(name="Motor_Direction", type_cls=parser.DINT)
+    before = tag_manager.tags["Motor_Direction"]["value"]
+
+    attribute[0:1] = []
+
+    assert tag_manager.tags["Motor_Direction"]["value"] == before
+    assert [r for r in caplog.records if r.levelno >= logging.ERROR]
+
+
+def test_service_handler_multiple_service_packet_in_order(service_handler, tag_manager):
+    """Test that a read after a write in one Multiple Service Packet sees the written value."""
+    tag_manager.add_tag("XY", "DINT", 5)
+    # Normal mode reads return the nominal value; this mode returns the stored one
+    tag_manager.mode = OperatingMode.UNRESPONSIVE
+
+    def service(service_code, path, data=b""):
+        return struct.pack("<H", 3 + len(path) + len(data)) + bytes([service_code]) + path + data
+
+    packet = (bytes([3])
+              + service(SERVICE_READ_TAG, b"XY")
+              + service(SERVICE_WRITE_TAG, b"XY", b"\xC4" + struct.pack("<i", 99))
+              + service(SERVICE_READ_TAG, b"XY"))
+
+    success, status, response = service_handler.handle_multiple_service_packet(packet)
+
+    assert success is True
+    replies = []
+    offset = 1
+    for _ in range(response[0]):
+        length = struct.unpack_from("<H", response, offset)[0]
+        replies.append(response[offset + 2:offset + length])
+        offset += length
+    assert struct.unpack("<i", replies[0][-4:])[0] == 5
+    assert replies[1][0] == 0
+    assert struct.unpack("<i", replies[2][-4:])[0] == 99
+
+
+def test_cip_plc_stop_wakes_housekeeping_thread():
+    """Test that stop() ends the housekeeping thread without waiting for its next tick."""
+    pytest.importorskip("cpppo")
+    import time
+    from mock.cip_plc import CIPPLC
+
+    plc = CIPPLC()
+    with patch.object(CIPPLC, "_run_server"):
+        plc.start()
+        started = time.monotonic()
+        plc.stop()
+
+    assert not plc.housekeeping_thread.is_alive()
+    assert time.monotonic() - started < 1.0
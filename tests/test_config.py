@@ -0,0 +1,147 @@
+"""Unit tests for configuration loader."""
+import dataclasses
+import pytest
+
+from app.config import ConfigLoader, PLCConfig, TagConfig, AAPConfig, ChaosConfig
+
+
+CONFIG_YAML = """
+plc:
+  ip_address: "${TEST_PLC_IP:-10.0.0.1}"
+  slot: ${TEST_PLC_SLOT:-0}
+  mock_mode: true
+
+tags:
+  motor_speed:
+    name: "Motor_Speed"
+    type: "int"
+    nominal: 1750
+    failure_condition: "outside_range"
+    failure_threshold_low: 1500
+    failure_threshold_high: 2000
+
+aap:
+  job_templates:
+    emergency_stop: 42
+
+logging:
+  level: "INFO"
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Write a minimal configuration file."""
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG_YAML)
+    return path
+
+
+def test_config_load(config_file, monkeypatch):
+    """Test loading configuration with environment variable substitution."""
+    monkeypatch.setenv("TEST_PLC_SLOT", "2")
+
+    config = ConfigLoader(str(config_file)).load()
+
+    assert config.plc.ip_address == "10.0.0.1"
+    assert config.plc.slot == 2
+    assert config.plc.mock_mode is True
+    assert config.tags["motor_speed"].name == "Motor_Speed"
+    assert config.aap.job_templates["emergency_stop"] == 42
+    assert config.logging.level == "INFO"
+
+
+def test_config_load_cached(config_file, monkeypatch):
+    """Test that the load cache is reused only while the file and its referenced env vars are unchanged."""
+    monkeypatch.setenv("TEST_PLC_IP", "10.0.0.2")
+    first = ConfigLoader(str(config_file)).load()
+    assert ConfigLoader(str(config_file)).load() is first
+
+    # Variables the file doesn't reference don't invalidate the cache
+    monkeypatch.setenv("TEST_UNRELATED_VAR", "1")
+    assert ConfigLoader(str(config_file)).load() is first
+
+    monkeypatch.setenv("TEST_PLC_IP", "10.0.0.3")
+    second = ConfigLoader(str(config_file)).load()
+
+    assert second is not first
+    assert second.plc.ip_address == "10.0.0.3"
+
+
+def test_config_missing_tag_field(tmp_path):
+    """Test that a tag missing its condition threshold is rejected."""
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG_YAML.replace("    failure_threshold_high: 2000\n", ""))
+
+    with pytest.raises(ValueError, match="failure_threshold_high"):
+        ConfigLoader(str(path)).load()
+
+
+def test_config_quoted_booleans(tmp_path):
+    """Test that quoted YAML booleans are parsed rather than truth-tested."""
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        CONFIG_YAML.replace("mock_mode: true", 'mock_mode: "false"')
+        .replace("aap:\n", 'aap:\n  verify_ssl: "false"\n  enabled: "yes"\n')
+    )
+
+    config = ConfigLoader(str(path)).load()
+
+    assert config.plc.mock_mode is False
+    assert config.aap.verify_ssl is False
+    assert config.aap.enabled is True
+
+    path.write_text(CONFIG_YAML.replace("aap:\n", 'aap:\n  verify_ssl: "maybe"\n'))
+    with pytest.raises(ValueError, match="verify_ssl"):
+        ConfigLoader(str(path)).load()
+
+
+def test_config_quoted_tag_thresholds(tmp_path):
+    """Test that quoted tag values are converted to the tag's type."""
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        CONFIG_YAML.replace("nominal: 1750", 'nominal: "1750"')
+        .replace("failure_threshold_low: 1500", 'failure_threshold_low: "1500"')
+        .replace("failure_threshold_high: 2000", 'failure_threshold_high: "2000"')
+    )
+
+    tag = ConfigLoader(str(path)).load().tags["motor_speed"]
+
+    assert tag.nominal == 1750
+    assert tag.failure_threshold_low == 1500
+    assert tag.failure_threshold_high == 2000
+    assert tag.predicate(2500) is True
+    assert tag.predicate(1750) is False
+
+    path.write_text(CONFIG_YAML.replace("failure_threshold_low: 1500", 'failure_threshold_low: "low"'))
+    with pytest.raises(ValueError, match="failure_threshold_low"):
+        ConfigLoader(str(path)).load()
+
+
+def test_config_dataclasses_frozen_and_slotted():
+    """Test that config objects are immutable and carry no instance __dict__."""
+    plc = PLCConfig(ip_address="192.168.1.100")
+    tag = TagConfig(name="Light_Status", type="bool", nominal=True,
+                    failure_condition="equals", failure_value=False)
+
+    for obj in (plc, tag, AAPConfig(), ChaosConfig()):
+        assert not hasattr(obj, '__dict__')
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        plc.slot = 1
+
+    # Mapping fields make AAPConfig (and so AppConfig) unhashable
+    assert hash(plc) == hash(PLCConfig(ip_address="192.168.1.100"))
+    with pytest.raises(TypeError):
+        hash(AAPConfig())
+
+
+def test_tag_config_predicate():
+    """Test the compiled failure-condition predicate."""
+    tag = TagConfig(name="Motor_Speed", type="int", nominal=1750,
+                    failure_condition="outside_range",
+                    failure_threshold_low=1500, failure_threshold_high=2000)
+
+    assert tag.predicate(2500) is True
+    assert tag.predicate(1000) is True
+    assert tag.predicate(1750) is False
@@ -1,10 +1,13 @@
 """Unit tests for monitor service."""
+import dataclasses
+import logging
 import pytest
 from unittest.mock import Mock, MagicMock, patch
+import socketio as socketio_server
 from datetime import datetime
 
 from app.monitor import MonitorService
-from app.config import AppConfig, PLCConfig, TagConfig, DashboardConfig, AAPConfig, RemediationConfig, ChaosConfig
+from app.config import AppConfig, PLCConfig, TagConfig, DashboardConfig, AAPConfig, RemediationConfig, ChaosConfig, LoggingConfig
 from app.plc_client import PLCClient
 from app.models import EventType
 
@@ -34,7 +37,8 @@ def app_config():
         aap=AAPConfig(),
         remediation=RemediationConfig(),
         chaos=ChaosConfig(),
-        dashboard=DashboardConfig()
+        dashboard=DashboardConfig(),
+        logging=LoggingConfig()
     )
 
 
@@ -113,3 +117,133 @@ def test_monitor_service_get_statistics(monitor_service):
     assert 'uptime_seconds' in stats
     assert 'total_tag_reads' in stats
     assert 'total_violations' in stats
+
+
+def test_monitor_service_poll_cycle_batches_tag_reads(app_config, mock_plc_client):
+    """Test that one poll cycle emits all tag reads in a single tags_update message."""
+    socketio = MagicMock()
+    monitor = MonitorService(app_config, mock_plc_client, socketio=socketio)
+
+    monitor._poll_cycle()
+
+    emitted = [c.args[0] for c in socketio.emit.call_args_list]
+    assert emitted.count('tags_update') == 1
+    assert 'tag_read' not in emitted
+    assert len(monitor.get_events(event_type=EventType.TAG_READ)) == 2
+
+
+def test_monitor_service_unchanged_tag_reads_rate_limited(monitor_service):
+    """Test that unchanged tag values are not re-emitted within the emit interval."""
+    monitor_service._poll_cycle()
+    monitor_service._poll_cycle()
+
+    assert len(monitor_service.get_events(event_type=EventType.TAG_READ)) == 2
+
+
+def test_monitor_service_violation_resolves_after_stable_polls(monitor_service, mock_plc_client):
+    """Test that a violation raised in a poll cycle resolves after consecutive normal reads."""
+    mock_plc_client.read_tags.return_value["Motor_Speed"].value = 2500
+    monitor_service._poll_cycle()
+    assert [v.tag_name for v in monitor_service.get_active_violations()] == ["motor_speed"]
+
+    mock_plc_client.read_tags.return_value["Motor_Speed"].value = 1750
+    for _ in range(monitor_service._violation_resolution_stability_polls):
+        monitor_service._poll_cycle()
+
+    assert monitor_service.get_active_violations() == []
+    resolved = monitor_service.get_resolved_violations()
+    assert len(resolved) == 1
+    assert resolved[0].resolved is True
+    assert resolved[0].actual_value == 2500
+
+
+def test_monitor_service_remediation_check_logged_on_change(monitor_service, caplog):
+    """Test that the auto-remediation check is logged at INFO only when its inputs change."""
+    caplog.set_level(logging.INFO, logger="app.monitor")
+
+    monitor_service._check_auto_remediation("motor_speed", False)
+    monitor_service._check_auto_remediation("motor_speed", False)
+    monitor_service.set_remediation_hook(Mock())
+    monitor_service._check_auto_remediation("motor_speed", False)
+
+    checks = [r for r in caplog.records if r.getMessage().startswith("Auto-remediation check")]
+    assert len(checks) == 2
+    assert all(r.levelno == logging.INFO for r in checks)
+
+
+def test_monitor_service_cleared_violation_not_mutated(monitor_service, mock_plc_client):
+    """Test that a held violation is unchanged when its tag is cleared and violates again."""
+    mock_plc_client.read_tags.return_value["Motor_Speed"].value = 2500
+    monitor_service._poll_cycle()
+    held = monitor_service.get_active_violations()[0]
+
+    held_timestamp = held.timestamp
+
+    # Clearing re-checks the current value, which re-raises the violation
+    monitor_service.clear_violation("motor_speed")
+
+    reraised = monitor_service.get_active_violations()[0]
+    assert reraised is not held
+    assert held.actual_value == 2500
+    assert held.timestamp == held_timestamp
+
+
+def test_monitor_service_get_tag_history(monitor_service):
+    """Test that tag history is returned as timestamp/value points."""
+    monitor_service._poll_cycle()
+    monitor_service._poll_cycle()
+
+    history = monitor_service.get_tag_history("motor_speed")
+    assert len(history) == 2
+    assert history[-1]['value'] == 1750
+    assert isinstance(history[-1]['timestamp'], str)
+    assert len(monitor_service.get_tag_history("motor_speed", limit=1)) == 1
+    assert monitor_service.get_tag_history("unknown") == []
+
+
+def test_monitor_service_skips_tag_read_emits_without_clients(app_config, mock_plc_client):
+    """Test that TAG_READ events are stored but not emitted while no Socket.IO client is connected."""
+    socketio = MagicMock()
+    socketio.server = socketio_server.Server()
+    monitor = MonitorService(app_config, mock_plc_client, socketio=socketio)
+
+    monitor._poll_cycle()
+
+    assert len(monitor.get_events(event_type=EventType.TAG_READ)) == 2
+    assert 'tags_update' not in [c.args[0] for c in socketio.emit.call_args_list]
+
+    socketio.server.manager.connect("eio-1", "/")
+    mock_plc_client.read_tags.return_value["Motor_Speed"].value = 1800
+    monitor._poll_cycle()
+
+    assert 'tags_update' in [c.args[0] for c in socketio.emit.call_args_list]
+
+
+def test_monitor_service_history_keeps_non_integer_values(monitor_service, mock_plc_client):
+    """Test that an int tag's history still records values that aren't integers."""
+    monitor_service._poll_cycle()
+    mock_plc_client.read_tags.return_value["Motor_Speed"].value = 1750.5
+    monitor_service._poll_cycle()
+
+    assert [p['value'] for p in monitor_service.get_tag_history("motor_speed")] == [1750, 1750.5]
+
+
+def test_monitor_service_history_keeps_value_types(app_config, mock_plc_client):
+    """Test that typed history buffers return values as the type they were read as."""
+    tags = dict(app_config.tags)
+    tags["pressure"] = TagConfig(name="Line_Pressure", type="float", nominal=40.0,
+                                 failure_condition="below", failure_threshold_low=10.0)
+    config = dataclasses.replace(app_config, tags=tags)
+    readings = mock_plc_client.read_tags.return_value
+    readings["Line_Pressure"] = Mock(success=True, value=40.5, timestamp=datetime.now(), error=None)
+    monitor_service = MonitorService(config, mock_plc_client, socketio=None)
+
+    monitor_service._poll_cycle()
+    readings["Line_Pressure"].value = 41
+    readings["Motor_Speed"].value = True
+    monitor_service._poll_cycle()
+
+    pressure = [p['value'] for p in monitor_service.get_tag_history("pressure")]
+    speed = [p['value'] for p in monitor_service.get_tag_history("motor_speed")]
+    assert pressure == [40.5, 41] and type(pressure[1]) is int
+    assert speed == [1750, True] and speed[1] is True
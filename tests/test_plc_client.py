@@ -1,7 +1,10 @@
 """Unit tests for PLC client."""
+import dataclasses
+import logging
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
+from pycomm3.exceptions import RequestError
 
 from app.plc_client import PLCClient
 from app.config import PLCConfig
@@ -95,6 +98,118 @@ def test_plc_client_read_tag_error(mock_driver_class, plc_client):
     assert result.error is not None
 
 
+@patch('app.plc_client.LogixDriver')
+def test_plc_client_read_tag_comm_error_logged(mock_driver_class, plc_client, caplog):
+    """Test that a failed read is logged at ERROR even when read timing is skipped."""
+    mock_driver = MagicMock()
+    mock_driver.connected = True
+    mock_driver.read.side_effect = RequestError("read failed")
+    mock_driver_class.return_value = mock_driver
+    caplog.set_level(logging.ERROR, logger="app.plc_client")
+
+    plc_client.connect()
+    result = plc_client.read_tag("Motor_Speed")
+
+    assert result.success is False
+    assert any("PLC read for 'Motor_Speed' failed" in r.getMessage() for r in caplog.records)
+
+
+@patch('app.plc_client.LogixDriver')
+def test_plc_client_read_tags_batch(mock_driver_class, plc_client):
+    """Test that multiple tags are read with a single driver call."""
+    mock_driver = MagicMock()
+    mock_driver.connected = True
+    speed = MagicMock(error=None, value=1750)
+    missing = MagicMock(error="Tag not found", value=None)
+    mock_driver.read.return_value = [speed, missing]
+    mock_driver_class.return_value = mock_driver
+
+    plc_client.connect()
+    results = plc_client.read_tags(["Motor_Speed", "InvalidTag"])
+
+    mock_driver.read.assert_called_once_with("Motor_Speed", "InvalidTag")
+    assert results["Motor_Speed"].success is True
+    assert results["Motor_Speed"].value == 1750
+    assert results["InvalidTag"].success is False
+    stats = plc_client.get_connection_stats()
+    assert stats.total_reads == 1
+    assert stats.total_errors == 1
+
+
+@patch('app.plc_client.LogixDriver')
+def test_plc_client_read_many(mock_driver_class, plc_client):
+    """Test that read_many returns results in request order."""
+    mock_driver = MagicMock()
+    mock_driver.connected = True
+    mock_driver.read.return_value = [MagicMock(error=None, value=True), MagicMock(error=None, value=1750)]
+    mock_driver_class.return_value = mock_driver
+
+    plc_client.connect()
+    results = plc_client.read_many(["Light_Status", "Motor_Speed"])
+
+    assert [r.tag_name for r in results] == ["Light_Status", "Motor_Speed"]
+    assert [r.value for r in results] == [True, 1750]
+
+
+@patch('app.plc_client.LogixDriver')
+def test_plc_client_read_tags_serial(mock_driver_class, plc_config):
+    """Test that serial mode reads tags one at a time with a shared timestamp."""
+    mock_driver = MagicMock()
+    mock_driver.connected = True
+    mock_driver.read.return_value = MagicMock(error=None, value=1)
+    mock_driver_class.return_value = mock_driver
+    plc_client = PLCClient(dataclasses.replace(plc_config, protocol_mode="serial"))
+
+    plc_client.connect()
+    now = datetime.now()
+    results = plc_client.read_tags(["Motor_Speed", "Light_Status"], timestamp=now)
+
+    assert [c.args for c in mock_driver.read.call_args_list] == [("Motor_Speed",), ("Light_Status",)]
+    assert results["Motor_Speed"].timestamp is now
+    assert results["Light_Status"].timestamp is now
+    assert plc_client.get_connection_stats().total_reads == 2
+
+
+@patch('app.plc_client.LogixDriver')
+def test_plc_client_read_cache(mock_driver_class, plc_config):
+    """Test that repeated reads within read_cache_ms are served from cache."""
+    mock_driver = MagicMock()
+    mock_driver.connected = True
+    mock_driver.read.return_value = MagicMock(error=None, value=1750)
+    mock_driver_class.return_value = mock_driver
+    plc_client = PLCClient(dataclasses.replace(plc_config, read_cache_ms=60000))
+
+    plc_client.connect()
+    first = plc_client.read_tag("Motor_Speed")
+    second = plc_client.read_tags(["Motor_Speed"])["Motor_Speed"]
+
+    assert second is first
+    assert mock_driver.read.call_count == 1
+
+    plc_client.write_tag("Motor_Speed", 1800)
+    plc_client.read_tag("Motor_Speed")
+    assert mock_driver.read.call_count == 2
+
+
+@patch('app.plc_client.LogixDriver')
+def test_plc_client_mock_mode_service_error(mock_driver_class, plc_config):
+    """Test that mock PLC service errors don't mark the connection as lost."""
+    mock_driver = MagicMock()
+    mock_driver.connected = True
+    mock_driver.read.side_effect = RequestError("Service not supported (0x08)")
+    mock_driver_class.return_value = mock_driver
+    plc_client = PLCClient(dataclasses.replace(plc_config, mock_mode=True))
+
+    plc_client.connect()
+    result = plc_client.read_tag("Motor_Speed")
+
+    assert result.success is False
+    assert result.error.startswith("Mock PLC limitation")
+    stats = plc_client.get_connection_stats()
+    assert stats.connected is True
+    assert stats.total_errors == 1
+
+
 def test_plc_client_disconnect(plc_client):
     """Test PLC disconnection."""
     plc_client.disconnect()
@@ -108,3 +223,23 @@ def test_plc_client_get_connection_stats(plc_client):
     assert stats.connected is False
     assert stats.total_reads == 0
     assert stats.total_errors == 0
+
+
+@patch('app.plc_client.LogixDriver')
+def test_plc_client_connection_stats_snapshot(mock_driver_class, plc_client):
+    """Test that returned statistics are not changed by later reads."""
+    mock_driver = MagicMock()
+    mock_driver.connected = True
+    mock_driver.read.return_value = MagicMock(error=None, value=1750)
+    mock_driver_class.return_value = mock_driver
+
+    plc_client.connect()
+    before = plc_client.get_connection_stats()
+    plc_client.read_tag("Motor_Speed")
+    after = plc_client.get_connection_stats()
+
+    assert before.connected is True
+    assert before.total_reads == 0
+    assert after.total_reads == 1
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        after.total_reads = 0